@@ -0,0 +1,228 @@
+"""Chunked, multi-process dial rotation counter for Advent of Code 2025 Day 1.
+
+Every rotation adds a signed offset to the dial modulo ``DIAL_SIZE``, so any
+run of rotations can be reduced to a summary: its net offset, plus a table
+giving the number of zero hits for every possible starting position.
+Summaries compose associatively, which lets a large rotation log be split
+into byte chunks that are reduced in separate processes and then combined
+in file order. The result is identical to the serial solvers.
+
+Usage:
+    uv run day01/chunked.py [--part2] [--workers N] input.txt
+"""
+
+import argparse
+import itertools
+import mmap
+import os
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+DIAL_SIZE = 100
+START_POSITION = 50
+BLOCK_SIZE = 1 << 24  # Bytes parsed at a time by each worker
+
+_LEFT = ord("L")
+_RIGHT = ord("R")
+
+
+class DialSummary(NamedTuple):
+    """Effect of a run of rotations on the dial."""
+
+    net_offset: int
+    """Net rotation of the run, modulo ``DIAL_SIZE``."""
+    zero_hits: tuple[int, ...]
+    """Zero hits during the run, indexed by the dial position it starts from."""
+
+
+IDENTITY = DialSummary(0, (0,) * DIAL_SIZE)
+
+
+def compose(first: DialSummary, second: DialSummary) -> DialSummary:
+    r"""Combine the summaries of two consecutive runs of rotations.
+
+    :param first: Summary of the earlier run.
+    :param second: Summary of the run that follows it.
+    :return: Summary of both runs performed in order.
+
+    Examples:
+    >>> a = summarize_rotations(b"L68\n", count_clicks=True)
+    >>> b = summarize_rotations(b"R30\n", count_clicks=True)
+    >>> ab = compose(a, b)
+    >>> ab.net_offset, ab.zero_hits[START_POSITION]
+    (62, 2)
+    >>> compose(IDENTITY, ab) == ab == compose(ab, IDENTITY)
+    True
+    """
+    shift = first.net_offset
+    zero_hits = tuple(
+        first.zero_hits[p] + second.zero_hits[(p + shift) % DIAL_SIZE]
+        for p in range(DIAL_SIZE)
+    )
+    return DialSummary((shift + second.net_offset) % DIAL_SIZE, zero_hits)
+
+
+def summarize_rotations(data: bytes, count_clicks: bool) -> DialSummary:
+    r"""Reduce a buffer of rotations to a :class:`DialSummary`.
+
+    With ``count_clicks`` false, a zero hit is a rotation that ends at 0 (part
+    1). Otherwise every click that lands on 0 counts (part 2). In that case
+    each rotation contributes a difference of two floor terms of the form
+    ``(p + c) // DIAL_SIZE``, and each term is a constant plus a step at a
+    fixed starting position ``p``. The per-position table is then a prefix
+    sum over those steps.
+
+    :param data: Raw rotation lines, e.g. ``b"L68\nR10\n"``.
+    :param count_clicks: Whether to count every click through 0 (part 2).
+    :return: Summary of the rotations in ``data``.
+    :raises ValueError: If a rotation is malformed.
+
+    Examples:
+    >>> summarize_rotations(b"L50\n", count_clicks=False).zero_hits[50]
+    1
+    >>> summarize_rotations(b"R250\n", count_clicks=True).zero_hits[50]
+    3
+    """
+    offset = 0  # Position relative to the start of the run, modulo DIAL_SIZE
+    base = 0
+    steps = [0] * DIAL_SIZE
+    for token in data.split():
+        direction = token[0]
+        try:
+            distance = int(token[1:])
+        except ValueError:
+            raise ValueError(f"Invalid rotation value: {token.decode()}")
+        if direction == _RIGHT:
+            terms = ((offset + distance, 1), (offset, -1))
+            offset = (offset + distance) % DIAL_SIZE
+        elif direction == _LEFT:
+            terms = ((offset - 1, 1), (offset - distance - 1, -1))
+            offset = (offset - distance) % DIAL_SIZE
+        else:
+            raise ValueError(f"Invalid rotation direction: {chr(direction)}")
+        if not count_clicks:
+            steps[(-offset) % DIAL_SIZE] += 1
+            continue
+        for c, sign in terms:
+            base += sign * (c // DIAL_SIZE)
+            if c % DIAL_SIZE:
+                steps[DIAL_SIZE - c % DIAL_SIZE] += sign
+    if not count_clicks:
+        return DialSummary(offset, tuple(steps))
+    zero_hits: list[int] = []
+    for step in steps:
+        base += step
+        zero_hits.append(base)
+    return DialSummary(offset, tuple(zero_hits))
+
+
+def split_at_newlines(buf: mmap.mmap, start: int, end: int, parts: int) -> list[int]:
+    """Split ``buf[start:end]`` into roughly equal pieces ending at newlines.
+
+    :param buf: Memory-mapped file contents.
+    :param start: First byte of the region to split.
+    :param end: One past the last byte of the region.
+    :param parts: Desired number of pieces.
+    :return: Sorted boundary offsets, beginning with ``start`` and ending with ``end``.
+    """
+    bounds = [start]
+    for i in range(1, parts):
+        target = start + (end - start) * i // parts
+        newline = buf.find(b"\n", max(target, bounds[-1]), end)
+        cut = end if newline == -1 else newline + 1
+        if cut > bounds[-1]:
+            bounds.append(cut)
+    if bounds[-1] != end:
+        bounds.append(end)
+    return bounds
+
+
+def _iter_blocks(buf: mmap.mmap, start: int, end: int) -> Iterator[bytes]:
+    """Yield ``buf[start:end]`` in newline-aligned blocks of about ``BLOCK_SIZE``."""
+    parts = max(1, -(-(end - start) // BLOCK_SIZE))
+    bounds = split_at_newlines(buf, start, end, parts)
+    for lo, hi in itertools.pairwise(bounds):
+        yield buf[lo:hi]
+
+
+def summarize_file_range(
+    path: str, start: int, end: int, count_clicks: bool
+) -> DialSummary:
+    """Summarize the rotations stored in bytes ``start..end`` of a file.
+
+    :param path: Path to the rotation log.
+    :param start: First byte of the range; must begin a line.
+    :param end: One past the last byte of the range; must end a line.
+    :param count_clicks: Whether to count every click through 0 (part 2).
+    :return: Summary of the rotations in the range.
+    """
+    summary = IDENTITY
+    with (
+        open(path, "rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf,
+    ):
+        for block in _iter_blocks(buf, start, end):
+            summary = compose(summary, summarize_rotations(block, count_clicks))
+    return summary
+
+
+def count_zeros_chunked(
+    path: str, count_clicks: bool = False, workers: int | None = None
+) -> int:
+    """Count zero hits for a rotation log using one process per chunk.
+
+    :param path: Path to the rotation log.
+    :param count_clicks: Count every click through 0 (part 2) instead of only
+        rotations that end at 0 (part 1).
+    :param workers: Number of worker processes; defaults to the CPU count. With
+        a single worker the file is processed in the calling process.
+    :return: The same count as the serial part 1 or part 2 solver.
+    """
+    workers = workers or os.cpu_count() or 1
+    size = os.path.getsize(path)
+    if size == 0:
+        return 0
+    with (
+        open(path, "rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf,
+    ):
+        bounds = split_at_newlines(buf, 0, size, workers)
+    ranges = list(itertools.pairwise(bounds))
+    if workers == 1:
+        summaries = [
+            summarize_file_range(path, lo, hi, count_clicks) for lo, hi in ranges
+        ]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            summaries = list(
+                pool.map(
+                    summarize_file_range,
+                    [path] * len(ranges),
+                    [lo for lo, _ in ranges],
+                    [hi for _, hi in ranges],
+                    [count_clicks] * len(ranges),
+                )
+            )
+    total = IDENTITY
+    for summary in summaries:
+        total = compose(total, summary)
+    return total.zero_hits[START_POSITION]
+
+
+def main() -> None:
+    """Run the chunked safe dial solution."""
+    parser = argparse.ArgumentParser(
+        description="Count safe dial zero hits using multiple processes."
+    )
+    parser.add_argument("input_file", help="rotation log, one rotation per line")
+    parser.add_argument(
+        "--part2", action="store_true", help="count every click through 0"
+    )
+    parser.add_argument("--workers", type=int, default=None, help="worker processes")
+    args = parser.parse_args()
+    print(count_zeros_chunked(args.input_file, args.part2, args.workers))
+
+
+if __name__ == "__main__":
+    main()
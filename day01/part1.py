@@ -3,7 +3,7 @@
 This script reads a sequence of dial rotations from an input file and counts how many times the dial points at 0 after any rotation.
 
 Usage:
-    uv run day01/part1.py input.txt
+    uv run python -m day01.part1 input.txt
 
 The input file should contain one rotation per line, e.g.:
     L68
@@ -11,9 +11,15 @@ The input file should contain one rotation per line, e.g.:
     ...
 """
 
+import io
 import sys
 from typing import TextIO
 
+try:
+    from day01 import vectorized
+except ImportError:  # NumPy is optional; fall back to the line-by-line loop
+    vectorized = None
+
 DIAL_SIZE = 100
 START_POSITION = 50
 
@@ -24,6 +30,12 @@ def count_zero_positions(input_file: TextIO) -> int:
     :param input_file: File-like object containing rotations, one per line.
     :return: Number of times the dial points at 0 after a rotation.
     """
+    if vectorized is not None:
+        data = input_file.read()
+        result = vectorized.count_zero_positions(data.encode())
+        if result is not None:
+            return result
+        input_file = io.StringIO(data)
     position = START_POSITION
     zero_count = 0
     for rotation_line in input_file:
@@ -50,7 +62,7 @@ def main() -> None:
     """Run the safe dial rotation solution."""
     expected_arg_count = 2
     if len(sys.argv) != expected_arg_count:
-        print("Usage: uv run day01/part1.py <input_file>", file=sys.stderr)
+        print("Usage: uv run python -m day01.part1 <input_file>", file=sys.stderr)
         sys.exit(1)
     input_path = sys.argv[1]
     with open(input_path, "r", encoding="utf-8") as f:
@@ -3,7 +3,7 @@
 This script reads a sequence of dial rotations from an input file and counts how many times the dial points at 0, including every click during each rotation.
 
 Usage:
-    uv run day01/part2.py input.txt
+    uv run python -m day01.part2 input.txt
 
 The input file should contain one rotation per line, e.g.:
     L68
@@ -11,19 +11,60 @@ The input file should contain one rotation per line, e.g.:
     ...
 """
 
+import io
 import sys
 from typing import TextIO
 
+try:
+    from day01 import vectorized
+except ImportError:  # NumPy is optional; fall back to the line-by-line loop
+    vectorized = None
+
 DIAL_SIZE = 100
 START_POSITION = 50
 
 
+def count_rotation_zeros(position: int, direction: str, distance: int) -> int:
+    """Count the clicks of a single rotation that leave the dial pointing at 0.
+
+    Rather than stepping click by click, the count is derived arithmetically.
+    A right rotation passes 0 once for every multiple of ``DIAL_SIZE`` reached
+    from ``position``. A left rotation is the mirror image, measured from the
+    distance remaining to 0 going left.
+
+    :param position: Dial position before the rotation, in ``[0, DIAL_SIZE)``.
+    :param direction: ``"L"`` or ``"R"``.
+    :param distance: Number of clicks in the rotation (non-negative).
+    :return: Number of clicks during the rotation that land on 0.
+    :raises ValueError: If ``direction`` is not ``"L"`` or ``"R"``.
+
+    Examples:
+    >>> count_rotation_zeros(50, "L", 68)
+    1
+    >>> count_rotation_zeros(0, "L", 5)
+    0
+    >>> count_rotation_zeros(50, "R", 1000)
+    10
+    """
+    if direction == "R":
+        return (position + distance) // DIAL_SIZE
+    if direction == "L":
+        return ((DIAL_SIZE - position) % DIAL_SIZE + distance) // DIAL_SIZE
+    raise ValueError(f"Invalid rotation direction: {direction}")
+
+
 def count_all_zero_positions(input_file: TextIO) -> int:
     """Count the number of times the dial points at 0 during and after rotations.
 
     :param input_file: File-like object containing rotations, one per line.
     :return: Number of times the dial points at 0 during or at the end of a rotation.
     """
+    if vectorized is not None:
+        data = input_file.read()
+        result = vectorized.count_all_zero_positions(data.encode())
+        if result is not None:
+            return result
+        input_file = io.StringIO(data)
     position = START_POSITION
     zero_count = 0
     for rotation_line in input_file:
@@ -35,15 +76,11 @@ def count_all_zero_positions(input_file: TextIO) -> int:
             distance = int(line[1:])
         except ValueError:
             raise ValueError(f"Invalid rotation value: {line}")
-        for _ in range(1, distance + 1):
-            if direction == "L":
-                position = (position - 1) % DIAL_SIZE
-            elif direction == "R":
-                position = (position + 1) % DIAL_SIZE
-            else:
-                raise ValueError(f"Invalid rotation direction: {direction}")
-            if position == 0:
-                zero_count += 1
+        zero_count += count_rotation_zeros(position, direction, distance)
+        if direction == "L":
+            position = (position - distance) % DIAL_SIZE
+        else:
+            position = (position + distance) % DIAL_SIZE
     return zero_count
 
 
@@ -51,7 +88,7 @@ def main() -> None:
     """Run the safe dial rotation solution for part 2."""
     expected_arg_count = 2
     if len(sys.argv) != expected_arg_count:
-        print("Usage: uv run day01/part2.py <input_file>", file=sys.stderr)
+        print("Usage: uv run python -m day01.part2 <input_file>", file=sys.stderr)
         sys.exit(1)
     input_path = sys.argv[1]
     with open(input_path, "r", encoding="utf-8") as f:
@@ -0,0 +1,72 @@
+"""Pytest for the chunked, multi-process Day 1 rotation counter.
+
+Checks that chunked summaries compose to the same answers as the serial solvers.
+"""
+
+import io
+import random
+from pathlib import Path
+
+import pytest
+
+from day01 import chunked, part1, part2
+
+SAMPLE = "L68\nL30\nR48\nL5\nR60\nL55\nL1\nL99\nR14\nL82\n"
+
+
+def _random_log(rng: random.Random, lines: int) -> str:
+    """Build a random rotation log."""
+    return "".join(f"{rng.choice('LR')}{rng.randint(0, 350)}\n" for _ in range(lines))
+
+
+def test_sample(tmp_path: Path):
+    """Test both parts on the sample input."""
+    path = tmp_path / "input.txt"
+    path.write_text(SAMPLE)
+    assert chunked.count_zeros_chunked(str(path), workers=1) == 3
+    assert chunked.count_zeros_chunked(str(path), count_clicks=True, workers=1) == 6
+
+
+def test_summaries_match_serial_solvers():
+    """Test that summaries of split logs compose to the serial answers."""
+    rng = random.Random(20251202)
+    for _ in range(50):
+        log = _random_log(rng, rng.randint(1, 40))
+        lines = log.splitlines(keepends=True)
+        cut = rng.randint(0, len(lines))
+        for count_clicks, solver in (
+            (False, part1.count_zero_positions),
+            (True, part2.count_all_zero_positions),
+        ):
+            summary = chunked.compose(
+                chunked.summarize_rotations(
+                    "".join(lines[:cut]).encode(), count_clicks
+                ),
+                chunked.summarize_rotations(
+                    "".join(lines[cut:]).encode(), count_clicks
+                ),
+            )
+            expected = solver(io.StringIO(log))
+            assert summary.zero_hits[chunked.START_POSITION] == expected
+
+
+def test_multiple_workers_and_blocks(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Test a file split across worker processes and small parse blocks."""
+    monkeypatch.setattr(chunked, "BLOCK_SIZE", 64)
+    log = _random_log(random.Random(7), 500)
+    path = tmp_path / "input.txt"
+    path.write_text(log)
+    assert chunked.count_zeros_chunked(str(path), workers=1) == (
+        part1.count_zero_positions(io.StringIO(log))
+    )
+    assert chunked.count_zeros_chunked(str(path), count_clicks=True, workers=3) == (
+        part2.count_all_zero_positions(io.StringIO(log))
+    )
+
+
+def test_invalid_rotation():
+    """Test that malformed rotations are rejected like the serial solvers."""
+    with pytest.raises(ValueError, match="direction"):
+        chunked.summarize_rotations(b"X10\n", count_clicks=False)
+    with pytest.raises(ValueError, match="value"):
+        chunked.summarize_rotations(b"Lxyz\n", count_clicks=True)
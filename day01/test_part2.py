@@ -4,6 +4,7 @@ Validates the solution against the provided test input and expected output.
 """
 
 import io
+import random
 
 from day01 import part2
 
@@ -24,3 +25,34 @@ L82
     expected_output = 6
     f = io.StringIO(test_input)
     assert part2.count_all_zero_positions(f) == expected_output
+
+
+def _count_by_clicks(rotations: list[str]) -> int:
+    """Count zero hits by stepping through every click (reference implementation)."""
+    position = part2.START_POSITION
+    zero_count = 0
+    for line in rotations:
+        step = -1 if line[0] == "L" else 1
+        for _ in range(int(line[1:])):
+            position = (position + step) % part2.DIAL_SIZE
+            if position == 0:
+                zero_count += 1
+    return zero_count
+
+
+def test_count_all_zero_positions_matches_click_loop():
+    """Test the arithmetic crossing count against a click-by-click simulation."""
+    rng = random.Random(20251201)
+    for _ in range(200):
+        rotations = [
+            f"{rng.choice('LR')}{rng.randint(0, 450)}"
+            for _ in range(rng.randint(1, 20))
+        ]
+        f = io.StringIO("\n".join(rotations) + "\n")
+        assert part2.count_all_zero_positions(f) == _count_by_clicks(rotations)
+
+
+def test_count_all_zero_positions_large_distance():
+    """Test that a huge rotation is counted without stepping through it."""
+    f = io.StringIO("R1000000000\nL1000000050\n")
+    assert part2.count_all_zero_positions(f) == 20000001
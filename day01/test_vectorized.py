@@ -0,0 +1,61 @@
+"""Pytest for the NumPy backend of the Day 1 solvers.
+
+Checks the vectorized counts against the line-by-line loops on random logs.
+"""
+
+import io
+import random
+
+import pytest
+
+from day01 import part1, part2, vectorized
+
+
+def _serial_counts(log: str, monkeypatch: pytest.MonkeyPatch) -> tuple[int, int]:
+    """Count both parts with the NumPy backend disabled."""
+    with monkeypatch.context() as m:
+        m.setattr(part1, "vectorized", None)
+        m.setattr(part2, "vectorized", None)
+        return (
+            part1.count_zero_positions(io.StringIO(log)),
+            part2.count_all_zero_positions(io.StringIO(log)),
+        )
+
+
+def test_matches_serial_solvers(monkeypatch: pytest.MonkeyPatch):
+    """Test the vectorized counts against the line-by-line solvers."""
+    rng = random.Random(20251203)
+    for _ in range(100):
+        limit = rng.choice([5, 150, 10**6, 10**17])
+        log = "".join(
+            f"{rng.choice('LR')}{rng.randint(0, limit)}\n"
+            for _ in range(rng.randint(0, 50))
+        )
+        data = log.encode()
+        assert (
+            vectorized.count_zero_positions(data),
+            vectorized.count_all_zero_positions(data),
+        ) == _serial_counts(log, monkeypatch)
+
+
+def test_line_endings():
+    """Test that CRLF line endings and blank lines are accepted."""
+    data = b"L68\r\nL30\r\n\r\nR48\r\nL5\r\nR60\r\nL55\r\nL1\r\nL99\r\nR14\r\nL82"
+    assert vectorized.count_zero_positions(data) == 3
+    assert vectorized.count_all_zero_positions(data) == 6
+
+
+@pytest.mark.parametrize(
+    "data", [b"L 5\n", b"R+5\n", b"X5\n", b"L\n", b"R" + b"9" * 19 + b"\n"]
+)
+def test_unsupported_input_falls_back(data: bytes):
+    """Test that input the bulk parser cannot handle is left to the serial loop."""
+    assert vectorized.parse_rotations(data) is None
+
+
+def test_solvers_report_invalid_rotations():
+    """Test that the public solvers still raise on malformed rotations."""
+    with pytest.raises(ValueError, match="direction"):
+        part1.count_zero_positions(io.StringIO("X5\n"))
+    with pytest.raises(ValueError, match="value"):
+        part2.count_all_zero_positions(io.StringIO("Lfive\n"))
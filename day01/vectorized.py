@@ -0,0 +1,126 @@
+"""NumPy backend for the Advent of Code 2025 Day 1 safe dial solvers.
+
+The whole rotation log is parsed into a signed ``int64`` array in one bulk
+pass over its bytes. Positions then come from a cumulative sum modulo
+``DIAL_SIZE``, and zero hits are counted with array reductions. The part 1
+and part 2 solvers use this backend automatically when NumPy is installed.
+
+Input the bulk parser does not handle falls back to the line-by-line
+solvers, which also produce their usual error messages. That covers
+whitespace inside lines, signs, malformed rotations, and distances with
+more than ``MAX_DIGITS`` digits. In those cases the functions here return
+``None``.
+"""
+
+import numpy as np
+from numpy.typing import NDArray
+
+DIAL_SIZE = 100
+START_POSITION = 50
+MAX_DIGITS = 18  # Largest distance that always fits in an int64
+
+_POWERS_OF_TEN = 10 ** np.arange(MAX_DIGITS, dtype=np.int64)
+_LOW_BITS = 32
+
+
+def parse_rotations(data: bytes) -> NDArray[np.int64] | None:
+    r"""Parse rotation lines into signed distances (``L`` negative, ``R`` positive).
+
+    Lines may end in ``\n`` or ``\r\n``; blank lines are skipped.
+
+    :param data: Raw contents of a rotation log.
+    :return: One signed distance per rotation, or ``None`` if the input needs
+        the line-by-line parser.
+
+    Examples:
+    >>> parse_rotations(b"L68\nR10\n\nR0\n").tolist()
+    [-68, 10, 0]
+    >>> parse_rotations(b"L 68\n") is None
+    True
+    """
+    raw = np.frombuffer(data, dtype=np.uint8)
+    separator = (raw == ord("\n")) | (raw == ord("\r"))
+    content = ~separator
+    previous = np.concatenate(([False], content[:-1]))
+    following = np.concatenate((content[1:], [False]))
+    starts = np.flatnonzero(content & ~previous)
+    ends = np.flatnonzero(content & ~following) + 1
+    lengths = ends - starts - 1  # Number of digits on each line
+    if np.any((lengths < 1) | (lengths > MAX_DIGITS)):
+        return None
+    direction = raw[starts]
+    is_left = direction == ord("L")
+    if not np.all(is_left | (direction == ord("R"))):
+        return None
+    body = content.copy()
+    body[starts] = False
+    digits = raw[body].astype(np.int64) - ord("0")
+    if np.any((digits < 0) | (digits > 9)):  # noqa: PLR2004
+        return None
+    # Exponent of each digit: distance from the end of its line, minus one
+    line_end = np.repeat(ends, lengths)
+    exponents = line_end - 1 - np.flatnonzero(body)
+    weighted = digits * _POWERS_OF_TEN[exponents]
+    offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    distances = np.add.reduceat(weighted, offsets) if len(starts) else weighted
+    return np.where(is_left, -distances, distances)
+
+
+def _positions_before(signed: NDArray[np.int64]) -> NDArray[np.int64]:
+    """Return the dial position before each rotation."""
+    steps = np.concatenate(([START_POSITION], signed[:-1] % DIAL_SIZE))
+    return np.cumsum(steps) % DIAL_SIZE
+
+
+def _exact_sum(values: NDArray[np.int64]) -> int:
+    """Sum non-negative int64 values without overflowing the accumulator."""
+    high = int(np.sum(values >> _LOW_BITS))
+    low = int(np.sum(values & ((1 << _LOW_BITS) - 1)))
+    return (high << _LOW_BITS) + low
+
+
+def count_zero_positions(data: bytes) -> int | None:
+    r"""Count rotations that leave the dial at 0 (part 1).
+
+    :param data: Raw contents of a rotation log.
+    :return: Number of rotations ending at 0, or ``None`` if the input needs
+        the line-by-line solver.
+
+    Examples:
+    >>> count_zero_positions(b"L68\nL30\nR48\nL5\nR60\nL55\nL1\nL99\nR14\nL82\n")
+    3
+    """
+    signed = parse_rotations(data)
+    if signed is None:
+        return None
+    positions = (START_POSITION + np.cumsum(signed % DIAL_SIZE)) % DIAL_SIZE
+    return int(np.count_nonzero(positions == 0))
+
+
+def count_all_zero_positions(data: bytes) -> int | None:
+    r"""Count every click that leaves the dial at 0 (part 2).
+
+    A rotation of ``d`` clicks passes 0 ``d // DIAL_SIZE`` times, plus once
+    more if the remaining ``d % DIAL_SIZE`` clicks reach 0 from the starting
+    position.
+
+    :param data: Raw contents of a rotation log.
+    :return: Number of clicks landing on 0, or ``None`` if the input needs the
+        line-by-line solver.
+
+    Examples:
+    >>> count_all_zero_positions(b"L68\nL30\nR48\nL5\nR60\nL55\nL1\nL99\nR14\nL82\n")
+    6
+    """
+    signed = parse_rotations(data)
+    if signed is None:
+        return None
+    if not len(signed):
+        return 0
+    position = _positions_before(signed)
+    distance = np.abs(signed)
+    # Clicks needed to first reach 0 in the direction of travel
+    to_zero = np.where(signed < 0, position, (DIAL_SIZE - position) % DIAL_SIZE)
+    remainder = distance % DIAL_SIZE
+    extra = (to_zero > 0) & (remainder >= to_zero)
+    return _exact_sum(distance // DIAL_SIZE) + int(np.count_nonzero(extra))
@@ -4,7 +4,9 @@ Day 2 Part 1: Find and sum all invalid product IDs in the given ranges.
 An invalid ID is a number made by repeating a sequence of digits twice.
 """
 
-import sys
+import argparse
+
+from day02.ranges import sum_invalid_ids_in_ranges
 
 
 def is_invalid_id(n: int) -> bool:
@@ -19,11 +21,22 @@ def is_invalid_id(n: int) -> bool:
 
 def main():
     """Read input ranges, find and sum all invalid product IDs, and print the result."""
-    # Accept input filename as first argument, default to 'input.txt'
-    input_file = sys.argv[1] if len(sys.argv) > 1 else "input.txt"
-    with open(input_file) as f:
+    parser = argparse.ArgumentParser(
+        description="Sum the IDs made of a sequence repeated twice."
+    )
+    parser.add_argument(
+        "input_file", nargs="?", default="input.txt", help="comma-separated ranges"
+    )
+    parser.add_argument("--workers", type=int, default=1, help="worker processes")
+    parser.add_argument(
+        "--merge-overlaps",
+        action="store_true",
+        help="count an ID covered by several ranges once instead of once per range",
+    )
+    args = parser.parse_args()
+    with open(args.input_file) as f:
         ranges = f.read().strip().split(",")
-    total = 0
+    bounds: list[tuple[int, int]] = []
     RANGE_SPLIT_COUNT = 2
     for r in ranges:
         if not r:
@@ -32,10 +45,15 @@ def main():
         if len(start_end) != RANGE_SPLIT_COUNT:
             continue
         start, end = map(int, start_end)
-        for n in range(start, end + 1):
-            if is_invalid_id(n):
-                total += n
-    print(total)
+        bounds.append((start, end))
+    print(
+        sum_invalid_ids_in_ranges(
+            bounds,
+            max_repeats=2,
+            workers=args.workers,
+            merge_overlaps=args.merge_overlaps,
+        )
+    )
 
 
 if __name__ == "__main__":
@@ -4,8 +4,11 @@ Puzzle: See puzzle-part2.txt for description
 Input: input.txt
 """
 
+import argparse
 import os
-import sys
+
+from day02.ranges import sum_invalid_ids_in_ranges
+from day02.repeats import sum_invalid_ids
 
 MIN_REPEAT = 2
 
@@ -40,6 +43,9 @@ def count_invalid_ids_in_range(start: int, end: int) -> int:
     """
     Count and sum all invalid IDs in a given range.
 
+    The total is evaluated in closed form per digit length and repeat period,
+    so the cost does not depend on the range width or the number of invalid IDs.
+
     Args:
         start (int): Start of the range (inclusive).
         end (int): End of the range (inclusive).
@@ -47,11 +53,7 @@ def count_invalid_ids_in_range(start: int, end: int) -> int:
     Returns:
         int: The sum of all invalid IDs in the range.
     """
-    count = 0
-    for i in range(start, end + 1):
-        if is_invalid_id(i):
-            count += i
-    return count
+    return sum_invalid_ids(start, end)
 
 
 def main() -> None:
@@ -60,22 +62,37 @@ def main() -> None:
 
     Accepts input file as a command-line argument, defaults to input.txt in the same directory.
     """
-    if len(sys.argv) > 1:
-        input_path = sys.argv[1]
-    else:
-        input_path = os.path.join(os.path.dirname(__file__), "input.txt")
-    with open(input_path) as f:
+    parser = argparse.ArgumentParser(
+        description="Sum the IDs made of a sequence repeated at least twice."
+    )
+    parser.add_argument(
+        "input_file",
+        nargs="?",
+        default=os.path.join(os.path.dirname(__file__), "input.txt"),
+        help="comma-separated ranges",
+    )
+    parser.add_argument("--workers", type=int, default=1, help="worker processes")
+    parser.add_argument(
+        "--merge-overlaps",
+        action="store_true",
+        help="count an ID covered by several ranges once instead of once per range",
+    )
+    args = parser.parse_args()
+    with open(args.input_file) as f:
         ranges = f.read().strip().split(",")
-    total = 0
+    bounds: list[tuple[int, int]] = []
     for r in ranges:
         if "-" in r:
             start, end = map(int, r.split("-"))
-            total += count_invalid_ids_in_range(start, end)
+            bounds.append((start, end))
         else:
             val = int(r)
-            if is_invalid_id(val):
-                total += val
-    print(total)
+            bounds.append((val, val))
+    print(
+        sum_invalid_ids_in_ranges(
+            bounds, workers=args.workers, merge_overlaps=args.merge_overlaps
+        )
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,68 @@
+"""Merge and evaluate the comma-separated ID ranges of Day 2.
+
+Overlapping ranges are merged before evaluation so that shared IDs are
+summed once, using a sort-and-coalesce pass. The disjoint ranges can then be
+evaluated across a process pool, and the per-range partial sums are added at
+the end.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+from day02.repeats import sum_invalid_ids
+
+
+def merge_ranges(ranges: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Merge overlapping or adjacent inclusive ranges.
+
+    :param ranges: ``(start, end)`` pairs, in any order.
+    :returns: Disjoint ranges sorted by start.
+
+    Examples:
+    >>> merge_ranges([(95, 115), (11, 22), (100, 120), (23, 30)])
+    [(11, 30), (95, 120)]
+    """
+    merged: list[tuple[int, int]] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def sum_invalid_ids_in_ranges(
+    ranges: list[tuple[int, int]],
+    max_repeats: int | None = None,
+    merge_overlaps: bool = True,
+    workers: int = 1,
+) -> int:
+    """Sum the invalid IDs across several inclusive ranges.
+
+    :param ranges: ``(start, end)`` pairs, in any order.
+    :param max_repeats: Largest number of repetitions to allow, or ``None``
+        for no limit. Part 1 uses ``2``.
+    :param merge_overlaps: Merge overlapping ranges so each ID counts once. If
+        false, an ID covered by several ranges is counted once per range.
+    :param workers: Number of worker processes; ``1`` evaluates the ranges in
+        the calling process.
+    :returns: The total of the invalid IDs in the ranges.
+
+    Examples:
+    >>> sum_invalid_ids_in_ranges([(95, 115), (11, 22), (100, 120)])
+    243
+    >>> sum_invalid_ids_in_ranges([(95, 115), (100, 120)], merge_overlaps=False)
+    321
+    """
+    if merge_overlaps:
+        ranges = merge_ranges(ranges)
+    starts = [start for start, _ in ranges]
+    ends = [end for _, end in ranges]
+    if workers == 1:
+        return sum(map(sum_invalid_ids, starts, ends, repeat(max_repeats)))
+    chunksize = max(1, len(ranges) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        partials = pool.map(
+            sum_invalid_ids, starts, ends, repeat(max_repeats), chunksize=chunksize
+        )
+        return sum(partials)
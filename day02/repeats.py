@@ -0,0 +1,140 @@
+"""Enumerate repeated-digit product IDs directly for Day 2.
+
+An invalid ID is a digit pattern repeated at least twice, so every invalid
+ID with ``length`` digits and a pattern of ``period`` digits equals the
+pattern times the repunit-style multiplier ``10**(period*(k-1)) + ... + 1``.
+Generating those products for each length and period visits only the
+invalid IDs in a range instead of every integer in it.
+
+The patterns for one period form a run of consecutive integers, so their sum
+inside a range is an arithmetic series times the multiplier. Combining the
+periods of a length by inclusion-exclusion gives range totals without
+visiting any IDs at all.
+"""
+
+import math
+from collections.abc import Iterator
+
+MIN_REPEAT = 2
+
+
+def repeat_multiplier(length: int, period: int) -> int:
+    """Return the multiplier that repeats a ``period``-digit pattern to ``length`` digits.
+
+    :param length: Total number of digits; must be a multiple of ``period``.
+    :param period: Number of digits in the repeated pattern.
+    :returns: The multiplier, e.g. ``10101`` for a 2-digit pattern repeated 3 times.
+
+    Examples:
+    >>> repeat_multiplier(6, 2)
+    10101
+    >>> 12 * repeat_multiplier(6, 2)
+    121212
+    """
+    return (10**length - 1) // (10**period - 1)
+
+
+def _allowed_periods(length: int, max_repeats: int | None) -> list[int]:
+    """Return the pattern lengths that repeat at least twice to ``length`` digits."""
+    return [
+        period
+        for period in range(1, length // MIN_REPEAT + 1)
+        if length % period == 0
+        and (max_repeats is None or length // period <= max_repeats)
+    ]
+
+
+def _pattern_bounds(
+    length: int, period: int, low: int, high: int
+) -> tuple[int, int, int]:
+    """Return the multiplier and pattern bounds whose products lie in ``[low, high]``."""
+    multiplier = repeat_multiplier(length, period)
+    first = max(10 ** (period - 1), -(-low // multiplier))
+    last = min(10**period - 1, high // multiplier)
+    return multiplier, first, last
+
+
+def invalid_ids_in_range(
+    start: int, end: int, max_repeats: int | None = None
+) -> Iterator[int]:
+    """Yield every repeated-pattern ID in ``[start, end]`` in increasing order.
+
+    IDs with several possible periods (such as ``1111``, which is both ``11``
+    twice and ``1`` four times) are yielded once.
+
+    :param start: Start of the range (inclusive).
+    :param end: End of the range (inclusive).
+    :param max_repeats: Largest number of repetitions to allow, or ``None``
+        for no limit. Part 1 uses ``2``.
+    :returns: An iterator over the invalid IDs in the range.
+
+    Examples:
+    >>> list(invalid_ids_in_range(95, 115))
+    [99, 111]
+    >>> list(invalid_ids_in_range(95, 115, max_repeats=2))
+    [99]
+    >>> list(invalid_ids_in_range(1100, 1111))
+    [1111]
+    """
+    start = max(start, 1)
+    for length in range(len(str(start)), len(str(end)) + 1):
+        low = max(start, 10 ** (length - 1))
+        high = min(end, 10**length - 1)
+        found: set[int] = set()
+        for period in _allowed_periods(length, max_repeats):
+            multiplier, first, last = _pattern_bounds(length, period, low, high)
+            found.update(pattern * multiplier for pattern in range(first, last + 1))
+        yield from sorted(found)
+
+
+def _period_sum(length: int, period: int, low: int, high: int) -> int:
+    """Sum the ``length``-digit IDs in ``[low, high]`` that repeat a ``period``-digit pattern."""
+    multiplier, first, last = _pattern_bounds(length, period, low, high)
+    if first > last:
+        return 0
+    return multiplier * (first + last) * (last - first + 1) // 2
+
+
+def sum_invalid_ids(start: int, end: int, max_repeats: int | None = None) -> int:
+    """Sum the repeated-pattern IDs in ``[start, end]`` without enumerating them.
+
+    For one digit length, the IDs repeating a ``p``-digit pattern and those
+    repeating a ``q``-digit pattern overlap in exactly the IDs repeating a
+    ``gcd(p, q)``-digit pattern. Inclusion-exclusion over the allowed periods
+    therefore reduces to a signed sum of per-period arithmetic series. With no
+    repeat limit, the signs are the Möbius function of ``length // period``.
+
+    :param start: Start of the range (inclusive).
+    :param end: End of the range (inclusive).
+    :param max_repeats: Largest number of repetitions to allow, or ``None``
+        for no limit. Part 1 uses ``2``.
+    :returns: The same total as summing :func:`invalid_ids_in_range`.
+
+    Examples:
+    >>> sum_invalid_ids(95, 115)
+    210
+    >>> sum_invalid_ids(1, 10**6) == sum(invalid_ids_in_range(1, 10**6))
+    True
+    """
+    start = max(start, 1)
+    total = 0
+    for length in range(len(str(start)), len(str(end)) + 1):
+        low = max(start, 10 ** (length - 1))
+        high = min(end, 10**length - 1)
+        if low > high:
+            continue
+        # Signed coefficient of each gcd of a non-empty subset of periods
+        coefficients: dict[int, int] = {}
+        for period in _allowed_periods(length, max_repeats):
+            updated = dict(coefficients)
+            updated[period] = updated.get(period, 0) + 1
+            for common, coefficient in coefficients.items():
+                g = math.gcd(common, period)
+                updated[g] = updated.get(g, 0) - coefficient
+            coefficients = updated
+        total += sum(
+            coefficient * _period_sum(length, period, low, high)
+            for period, coefficient in coefficients.items()
+            if coefficient
+        )
+    return total
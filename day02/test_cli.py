@@ -0,0 +1,24 @@
+"""Tests for the day02 command-line entry points."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+@pytest.mark.parametrize("part", ["part1", "part2"])
+def test_overlapping_ranges(tmp_path: Path, part: str) -> None:
+    """Test that overlaps count per range unless ``--merge-overlaps`` is given."""
+    path = tmp_path / "input.txt"
+    path.write_text("9-12,11-22\n")
+
+    def run(*flags: str) -> str:
+        command = [sys.executable, "-m", f"day02.{part}", *flags, str(path)]
+        return subprocess.run(
+            command, capture_output=True, text=True, check=True
+        ).stdout
+
+    assert run() == "44\n"
+    assert run("--merge-overlaps") == "33\n"
+    assert run("--workers", "2") == "44\n"
@@ -0,0 +1,47 @@
+"""Unit tests for merged and parallel range evaluation (Day 2)."""
+
+import random
+
+from day02.part2 import is_invalid_id
+from day02.ranges import sum_invalid_ids_in_ranges
+from day02.repeats import sum_invalid_ids
+
+
+def _random_ranges(rng: random.Random, count: int) -> list[tuple[int, int]]:
+    """Build random, possibly overlapping, ranges."""
+    ranges: list[tuple[int, int]] = []
+    for _ in range(count):
+        start = rng.randint(1, 10**7)
+        ranges.append((start, start + rng.randint(0, 10**5)))
+    return ranges
+
+
+def test_overlaps_counted_once():
+    """Test that merged ranges count each invalid ID once."""
+    rng = random.Random(20251207)
+    ranges = [
+        (start, start + rng.randint(0, 5000))
+        for start in rng.sample(range(1, 50000), 40)
+    ]
+    covered = {n for start, end in ranges for n in range(start, end + 1)}
+    expected = sum(n for n in covered if is_invalid_id(n))
+    assert sum_invalid_ids_in_ranges(ranges) == expected
+
+
+def test_double_counting_flag():
+    """Test that merge_overlaps=False keeps the per-range totals."""
+    rng = random.Random(20251208)
+    ranges = _random_ranges(rng, 40)
+    expected = sum(sum_invalid_ids(start, end, 2) for start, end in ranges)
+    assert (
+        sum_invalid_ids_in_ranges(ranges, max_repeats=2, merge_overlaps=False)
+        == expected
+    )
+
+
+def test_process_pool_matches_serial():
+    """Test that evaluating ranges in worker processes gives the serial total."""
+    ranges = _random_ranges(random.Random(20251209), 100)
+    assert sum_invalid_ids_in_ranges(ranges, workers=2) == (
+        sum_invalid_ids_in_ranges(ranges)
+    )
@@ -0,0 +1,72 @@
+"""Unit tests for the repeated-pattern ID enumerator (Day 2)."""
+
+import random
+
+from day02 import part1, part2
+from day02.repeats import invalid_ids_in_range, sum_invalid_ids
+
+
+def test_matches_scan_on_random_ranges():
+    """Test the enumerator against scanning every integer with is_invalid_id."""
+    rng = random.Random(20251204)
+    for _ in range(300):
+        start = rng.randint(1, 2_000_000)
+        end = start + rng.randint(0, 3000)
+        assert list(invalid_ids_in_range(start, end)) == [
+            n for n in range(start, end + 1) if part2.is_invalid_id(n)
+        ]
+        assert list(invalid_ids_in_range(start, end, max_repeats=2)) == [
+            n for n in range(start, end + 1) if part1.is_invalid_id(n)
+        ]
+
+
+def test_duplicate_periods_counted_once():
+    """Test that IDs with several periods, like 1111 and 222222, appear once."""
+    assert list(invalid_ids_in_range(1111, 1111)) == [1111]
+    assert list(invalid_ids_in_range(222222, 222222)) == [222222]
+
+
+def test_empty_and_wide_ranges():
+    """Test empty ranges and a range far too wide to scan."""
+    assert list(invalid_ids_in_range(12, 21)) == []
+    assert list(invalid_ids_in_range(30, 20)) == []
+    ids = list(invalid_ids_in_range(1, 10**10))
+    assert len(ids) == len(set(ids)) == 101_088
+    assert part2.count_invalid_ids_in_range(1, 10**10) == sum(ids)
+
+
+def test_sum_matches_scan_on_random_ranges():
+    """Property check: the closed-form sum equals is_invalid_id summation."""
+    rng = random.Random(20251205)
+    for _ in range(300):
+        start = rng.randint(1, 10 ** rng.randint(1, 7))
+        end = start + rng.randint(0, 2000)
+        scanned = range(start, end + 1)
+        assert sum_invalid_ids(start, end) == sum(
+            n for n in scanned if part2.is_invalid_id(n)
+        )
+        assert sum_invalid_ids(start, end, max_repeats=2) == sum(
+            n for n in scanned if part1.is_invalid_id(n)
+        )
+
+
+def test_sum_matches_enumeration_on_wide_ranges():
+    """Property check: the closed-form sum equals the enumerator for any repeat limit."""
+    rng = random.Random(20251206)
+    for _ in range(50):
+        start = rng.randint(1, 10**9)
+        end = start + rng.randint(0, 10**9)
+        max_repeats = rng.choice([None, 2, 3, 4])
+        assert sum_invalid_ids(start, end, max_repeats) == sum(
+            invalid_ids_in_range(start, end, max_repeats)
+        )
+
+
+def test_sum_huge_range():
+    """Test a range holding far too many invalid IDs to enumerate."""
+    # Only 2 repeats: each 2k-digit ID is a k-digit pattern times 10**k + 1
+    expected = sum(
+        (10**k + 1) * (10 ** (k - 1) + 10**k - 1) * (9 * 10 ** (k - 1)) // 2
+        for k in range(1, 16)
+    )
+    assert sum_invalid_ids(1, 10**30, max_repeats=2) == expected
@@ -0,0 +1,134 @@
+"""Multi-process, memory-mapped bank processor for Day 3.
+
+The bank file is memory-mapped and cut at newline boundaries into slices.
+Each slice is maximized in a worker process, and the partial totals are
+summed as they arrive. Progress and throughput go to stderr so that stdout
+carries only the answer.
+
+Usage:
+    uv run python -m day03.chunked [-k DIGITS] [--workers N] input.txt
+"""
+
+import argparse
+import itertools
+import mmap
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import TextIO
+
+from day03.joltage import total_joltage_and_count
+
+SLICE_SIZE = 1 << 26  # Bytes handed to a worker at a time
+_MEGABYTE = 1 << 20
+
+
+def _split_at_newlines(buf: mmap.mmap, start: int, end: int, parts: int) -> list[int]:
+    """Split ``buf[start:end]`` into roughly equal pieces ending at newlines.
+
+    :param buf: Memory-mapped file contents.
+    :param start: First byte of the region to split.
+    :param end: One past the last byte of the region.
+    :param parts: Desired number of pieces.
+    :returns: Sorted boundary offsets, beginning with ``start`` and ending with ``end``.
+    """
+    bounds = [start]
+    for i in range(1, parts):
+        target = start + (end - start) * i // parts
+        newline = buf.find(b"\n", max(target, bounds[-1]), end)
+        cut = end if newline == -1 else newline + 1
+        if cut > bounds[-1]:
+            bounds.append(cut)
+    if bounds[-1] != end:
+        bounds.append(end)
+    return bounds
+
+
+def sum_file_slice(path: str, start: int, end: int, k: int) -> tuple[int, int, int]:
+    """Maximize every bank stored in bytes ``start..end`` of a file.
+
+    :param path: Path to the bank file.
+    :param start: First byte of the slice; must begin a line.
+    :param end: One past the last byte of the slice; must end a line.
+    :param k: Number of digits to select from each bank.
+    :returns: The slice's total joltage, bank count, and size in bytes.
+    """
+    with (
+        open(path, "rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf,
+    ):
+        data = buf[start:end]
+    joltage, banks = total_joltage_and_count(data, k)
+    return joltage, banks, end - start
+
+
+def _report(progress: TextIO, banks: int, size: int, elapsed: float) -> None:
+    """Write a progress line with bank and byte throughput."""
+    elapsed = max(elapsed, 1e-9)
+    progress.write(
+        f"\r{banks} banks, {size / _MEGABYTE:.1f} MB"
+        f" ({banks / elapsed:.0f} banks/s, {size / _MEGABYTE / elapsed:.1f} MB/s)"
+    )
+    progress.flush()
+
+
+def total_joltage_file(
+    path: str,
+    k: int,
+    workers: int | None = None,
+    progress: TextIO | None = None,
+) -> int:
+    """Sum the best ``k``-digit joltage of every bank in a file using a process pool.
+
+    :param path: Path to the bank file, one bank per line.
+    :param k: Number of digits to select from each bank.
+    :param workers: Number of worker processes; defaults to the CPU count.
+    :param progress: Stream for progress and throughput reports, if any.
+    :returns: The total joltage over all banks.
+    """
+    workers = workers or os.cpu_count() or 1
+    size = os.path.getsize(path)
+    if size == 0:
+        return 0
+    with (
+        open(path, "rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf,
+    ):
+        parts = max(workers, -(-size // SLICE_SIZE))
+        bounds = _split_at_newlines(buf, 0, size, parts)
+    started = time.perf_counter()
+    total = banks = done = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(sum_file_slice, path, lo, hi, k)
+            for lo, hi in itertools.pairwise(bounds)
+        ]
+        for future in as_completed(futures):
+            joltage, slice_banks, slice_size = future.result()
+            total += joltage
+            banks += slice_banks
+            done += slice_size
+            if progress is not None:
+                _report(progress, banks, done, time.perf_counter() - started)
+    if progress is not None:
+        progress.write("\n")
+    return total
+
+
+def main() -> None:
+    """Run the multi-process Day 3 solution on a bank file."""
+    parser = argparse.ArgumentParser(
+        description="Sum the best joltage of every bank using multiple processes."
+    )
+    parser.add_argument("input_file", help="bank file, one bank per line")
+    parser.add_argument(
+        "-k", type=int, default=12, help="digits to select per bank (default: 12)"
+    )
+    parser.add_argument("--workers", type=int, default=None, help="worker processes")
+    args = parser.parse_args()
+    print(total_joltage_file(args.input_file, args.k, args.workers, sys.stderr))
+
+
+if __name__ == "__main__":
+    main()
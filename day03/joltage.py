@@ -0,0 +1,77 @@
+"""Best k-digit subsequence engine for Day 3 battery banks.
+
+Picking ``k`` digits in order to form the largest number is the classic
+"remove ``n - k`` digits" problem. A monotonic stack solves it in one pass:
+while a larger digit arrives and digits may still be dropped, smaller digits
+on top of the stack are discarded. Banks are handled as raw bytes, so digit
+comparisons work on byte values and no per-digit strings are created.
+"""
+
+_DIGITS = b"0123456789"
+_WHITESPACE = b" \t\r\n"
+
+
+def best_joltage(bank: bytes, k: int) -> int:
+    """Return the largest number formed by ``k`` digits of ``bank`` taken in order.
+
+    :param bank: ASCII digits of one battery bank.
+    :param k: Number of digits to select.
+    :returns: The largest ``k``-digit number that can be formed, or 0 if the
+        bank has fewer than ``k`` digits.
+
+    Examples:
+    >>> best_joltage(b"818181911112111", 2)
+    92
+    >>> best_joltage(b"818181911112111", 12)
+    888911112111
+    >>> best_joltage(b"7", 2)
+    0
+    """
+    drop = len(bank) - k
+    if drop < 0:
+        return 0
+    stack = bytearray()
+    for digit in bank:
+        while drop and stack and stack[-1] < digit:
+            stack.pop()
+            drop -= 1
+        stack.append(digit)
+    return int(stack[:k])
+
+
+def total_joltage(data: bytes, k: int) -> int:
+    r"""Sum the best ``k``-digit joltage of every bank in a file's contents.
+
+    :param data: Raw file contents with one bank per line; blank lines are ignored.
+    :param k: Number of digits to select from each bank.
+    :returns: The total joltage over all banks. Banks with fewer than ``k``
+        digits contribute 0.
+    :raises ValueError: If the data contains anything other than digits and
+        whitespace.
+
+    Examples:
+    >>> total_joltage(b"987654321111111\n811111111111119\n", 2)
+    187
+    """
+    return total_joltage_and_count(data, k)[0]
+
+
+def total_joltage_and_count(data: bytes, k: int) -> tuple[int, int]:
+    r"""Sum the best ``k``-digit joltage of every bank and count the banks.
+
+    The data is split into banks only once, for both results.
+
+    :param data: Raw file contents with one bank per line; blank lines are ignored.
+    :param k: Number of digits to select from each bank.
+    :returns: The total joltage over all banks and the number of banks.
+    :raises ValueError: If the data contains anything other than digits and
+        whitespace.
+
+    Examples:
+    >>> total_joltage_and_count(b"987654321111111\n\n811111111111119\n", 2)
+    (187, 2)
+    """
+    if data.translate(None, _DIGITS + _WHITESPACE):
+        raise ValueError("Banks may only contain digits")
+    banks = data.split()
+    return sum(best_joltage(bank, k) for bank in banks), len(banks)
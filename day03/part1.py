@@ -1,29 +1,23 @@
 """Part 1 solution for Day 3: Find the largest two-digit number from a string of digits."""
 
+from day03.joltage import best_joltage, total_joltage
+
+DIGITS_PER_BANK = 2
+
 
 def max_joltage_from_bank(bank: str) -> int:
     """Given a string of digits, return the largest two-digit number that can be formed.
 
-    Select any two digits in order (not necessarily adjacent).
+    Select any two digits in order (not necessarily adjacent). Banks with
+    fewer than two digits have no joltage.
     """
-    max_joltage = 0
-    n = len(bank)
-    for i in range(n - 1):
-        for j in range(i + 1, n):
-            joltage = int(bank[i] + bank[j])
-            max_joltage = max(max_joltage, joltage)
-    return max_joltage
+    return best_joltage(bank.encode(), DIGITS_PER_BANK)
 
 
 def main():
     """Read input and print the total maximum joltage for all banks."""
-    total = 0
-    with open("day03/input.txt") as f:
-        for line in f:
-            line_stripped = line.strip()
-            if line_stripped:
-                total += max_joltage_from_bank(line_stripped)
-    print(total)
+    with open("day03/input.txt", "rb") as f:
+        print(total_joltage(f.read(), DIGITS_PER_BANK))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,34 @@
+"""Unit tests for the day03 multi-process bank processor."""
+
+import io
+import random
+from pathlib import Path
+
+import pytest
+
+from day03 import chunked
+from day03.joltage import total_joltage
+
+
+def test_matches_serial_total(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Test that slices summed across workers match the serial total."""
+    monkeypatch.setattr(chunked, "SLICE_SIZE", 256)
+    rng = random.Random(20251211)
+    data = "".join(
+        "".join(rng.choice("123456789") for _ in range(rng.randint(12, 40))) + "\n"
+        for _ in range(200)
+    ).encode()
+    path = tmp_path / "banks.txt"
+    path.write_bytes(data)
+    progress = io.StringIO()
+    result = chunked.total_joltage_file(str(path), 12, workers=2, progress=progress)
+    assert result == total_joltage(data, 12)
+    assert "200 banks" in progress.getvalue()
+    assert "MB/s" in progress.getvalue()
+
+
+def test_empty_file(tmp_path: Path):
+    """Test that an empty file has no joltage."""
+    path = tmp_path / "banks.txt"
+    path.write_bytes(b"")
+    assert chunked.total_joltage_file(str(path), 2, workers=2) == 0
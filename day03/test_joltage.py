@@ -0,0 +1,37 @@
+"""Unit tests for the day03 best k-digit subsequence engine."""
+
+import itertools
+import random
+
+import pytest
+
+from day03.joltage import best_joltage, total_joltage
+
+
+def test_matches_brute_force():
+    """Test best_joltage against trying every k-digit subsequence."""
+    rng = random.Random(20251210)
+    for _ in range(300):
+        bank = "".join(rng.choice("123456789") for _ in range(rng.randint(1, 9)))
+        k = rng.randint(1, len(bank))
+        expected = max(int("".join(c)) for c in itertools.combinations(bank, k))
+        assert best_joltage(bank.encode(), k) == expected
+
+
+def test_total_joltage_batch():
+    """Test summing several banks from raw bytes, including blank and CRLF lines."""
+    data = b"987654321111111\r\n811111111111119\n\n234234234234278\n818181911112111\n"
+    assert total_joltage(data, 2) == 357
+    assert total_joltage(data, 12) == 3121910778619
+
+
+def test_short_banks():
+    """Test that banks with fewer than k digits contribute no joltage."""
+    assert best_joltage(b"12", 3) == 0
+    assert total_joltage(b"7\n98\n", 2) == 98
+
+
+def test_invalid_input():
+    """Test that non-digit data is rejected."""
+    with pytest.raises(ValueError, match="digits"):
+        total_joltage(b"12a4\n", 2)
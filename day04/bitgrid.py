@@ -0,0 +1,142 @@
+"""Bit-packed paper roll grid for Day 4.
+
+Each grid row is stored as one Python ``int`` with bit ``c`` set when
+column ``c`` holds a roll, so a cell costs one bit instead of a list slot
+and a one-character string. Neighbor counts for a whole row are computed at
+once. The eight shifted neighbor rows are added into bit-sliced counters,
+where plane ``k`` holds bit ``k`` of every cell's count, using only bitwise
+operations. A roll is accessible when its count has neither the 4s nor the
+8s bit set.
+"""
+
+from collections.abc import Iterable
+from typing import Self
+
+ADJACENT_THRESHOLD: int = 4  # Rolls with fewer than this many adjacent are accessible
+_COUNTER_BITS: int = 4  # Enough for counts 0..8
+_TO_BITS = bytes(ord("1") if b == ord("@") else ord("0") for b in range(256))
+
+
+class BitGrid:
+    """Grid of paper rolls with one bit per cell."""
+
+    def __init__(self, rows: list[int], width: int) -> None:
+        """Initialize from bit-packed rows.
+
+        :param rows: One int per row; bit ``c`` is set for a roll in column ``c``.
+        :param width: Number of columns.
+        """
+        self.rows = rows
+        self.width = width
+        self._mask = (1 << width) - 1
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str]) -> Self:
+        """Pack grid lines, treating short lines as padded with empty cells.
+
+        Any character other than ``"@"`` is an empty cell.
+
+        :param lines: Grid rows as strings, without line terminators.
+        :returns: The packed grid.
+
+        Examples:
+        >>> BitGrid.from_lines(["@.@", "@@"]).rows
+        [5, 3]
+        """
+        rows: list[int] = []
+        width = 0
+        for line in lines:
+            bits = line.encode()[::-1].translate(_TO_BITS)
+            rows.append(int(bits or b"0", 2))
+            width = max(width, len(line))
+        return cls(rows, width)
+
+    def roll_count(self) -> int:
+        """Return the number of rolls in the grid."""
+        return sum(row.bit_count() for row in self.rows)
+
+    def accessible_bits(self, r: int) -> int:
+        """Return the bits of row ``r`` whose rolls are accessible.
+
+        :param r: Row index.
+        :returns: Bit mask of the accessible rolls in the row.
+        """
+        row = self.rows[r]
+        above = self.rows[r - 1] if r > 0 else 0
+        below = self.rows[r + 1] if r + 1 < len(self.rows) else 0
+        counters = [0] * _COUNTER_BITS
+        for line in (above, row, below):
+            for plane in ((line << 1) & self._mask, line >> 1):
+                self._add_plane(counters, plane)
+        self._add_plane(counters, above)
+        self._add_plane(counters, below)
+        at_least_four = counters[2] | counters[3]
+        return row & ~at_least_four
+
+    @staticmethod
+    def _add_plane(counters: list[int], plane: int) -> None:
+        """Add a one-bit-per-cell plane into the bit-sliced counters."""
+        carry = plane
+        for k in range(_COUNTER_BITS):
+            if not carry:
+                break
+            counters[k], carry = counters[k] ^ carry, counters[k] & carry
+
+    def count_accessible(self) -> int:
+        """Count the rolls with fewer than ``ADJACENT_THRESHOLD`` adjacent rolls.
+
+        Examples:
+        >>> BitGrid.from_lines(["@@@", "@@@", "@@@"]).count_accessible()
+        4
+        """
+        return sum(self.accessible_bits(r).bit_count() for r in range(len(self.rows)))
+
+    def remove_all_accessible(self, round_counts: list[int] | None = None) -> int:
+        """Remove accessible rolls in rounds until none are left.
+
+        Each round removes every roll that is accessible at its start, like
+        repeated calls to ``remove_accessible``. Only rows next to a row that
+        changed are re-examined in the following round. The grid is modified
+        in place.
+
+        :param round_counts: If given, the number of rolls removed in each
+            round is appended to it.
+        :returns: Total number of rolls removed.
+
+        Examples:
+        >>> grid = BitGrid.from_lines(["@@@", "@@@", "@@@"])
+        >>> rounds: list[int] = []
+        >>> grid.remove_all_accessible(rounds), rounds, grid.roll_count()
+        (9, [4, 4, 1], 0)
+        """
+        dirty: set[int] = set(range(len(self.rows)))
+        total = 0
+        while dirty:
+            removed, dirty = self.remove_round(dirty)
+            if not removed:
+                break
+            total += removed
+            if round_counts is not None:
+                round_counts.append(removed)
+        return total
+
+    def remove_round(self, candidates: Iterable[int]) -> tuple[int, set[int]]:
+        """Remove, all at once, the accessible rolls in the given rows.
+
+        Accessibility is decided for every candidate row before any roll is
+        removed, so the round sees a consistent snapshot of the grid.
+
+        :param candidates: Indices of the rows that may hold accessible rolls.
+        :returns: The number of rolls removed and the rows whose neighbor
+            counts changed, which are the only candidates for the next round.
+        """
+        height = len(self.rows)
+        removals = {r: self.accessible_bits(r) for r in sorted(candidates)}
+        removed = 0
+        changed: set[int] = set()
+        for r, bits in removals.items():
+            if bits:
+                self.rows[r] &= ~bits
+                removed += bits.bit_count()
+                changed.update(n for n in (r - 1, r, r + 1) if 0 <= n < height)
+        return removed, changed
@@ -1,5 +1,15 @@
 """Day 4 Part 1: Count accessible rolls of paper in a grid."""
 
+import os
+import sys
+
+from day04.bitgrid import BitGrid
+
+try:
+    from day04 import vectorized
+except ImportError:  # NumPy is optional; fall back to the per-cell loops
+    vectorized = None
+
 ADJACENT_THRESHOLD: int = 4  # Forklifts can access if fewer than 4 adjacent rolls
 
 
@@ -7,7 +17,12 @@ def count_accessible_rolls(grid: list[list[str]]) -> int:
     """Count the number of accessible rolls of paper in the grid.
 
     A roll is accessible if there are fewer than ADJACENT_THRESHOLD '@' in the 8 adjacent cells.
+    When NumPy is installed, all neighbor counts are computed in one vectorized pass.
     """
+    if vectorized is not None:
+        return vectorized.count_accessible(
+            vectorized.occupancy(["".join(row) for row in grid])
+        )
     rows: int = len(grid)
     cols: int = len(grid[0]) if rows > 0 else 0
     accessible: int = 0
@@ -30,12 +45,19 @@ def count_accessible_rolls(grid: list[list[str]]) -> int:
 
 
 def main() -> None:
-    """Read the input file and print the number of accessible rolls."""
-    with open("input.txt") as f:
-        lines: list[str] = [line.rstrip("\n") for line in f if line.strip()]
-    maxlen: int = max(len(line) for line in lines)
-    grid: list[list[str]] = [list(line.ljust(maxlen, ".")) for line in lines]
-    print(count_accessible_rolls(grid))
+    """Read the input file and print the number of accessible rolls.
+
+    Accepts the input file as a command-line argument, defaulting to input.txt
+    in the same directory. The grid is bit-packed as it is read, so large maps
+    fit in memory.
+    """
+    if len(sys.argv) > 1:
+        input_path = sys.argv[1]
+    else:
+        input_path = os.path.join(os.path.dirname(__file__), "input.txt")
+    with open(input_path) as f:
+        grid = BitGrid.from_lines(line.rstrip("\n") for line in f if line.strip())
+    print(grid.count_accessible())
 
 
 if __name__ == "__main__":
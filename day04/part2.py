@@ -2,21 +2,17 @@
 
 import sys
 
+from day04.peel import count_removable
+
 ADJACENT_THRESHOLD: int = 4  # Rolls with fewer than this many adjacent are accessible
 EXPECTED_ARG_COUNT: int = 2  # Script name + input file
 
 
 def main(filename: str) -> None:
-    """Remove accessible rolls in rounds and print the total removed."""
+    """Remove accessible rolls until none remain and print the total removed."""
     with open(filename) as f:
         grid: list[list[str]] = parse_grid(f.readlines())
-    total_removed: int = 0
-    while True:
-        removed: int = remove_accessible(grid)
-        if removed == 0:
-            break
-        total_removed += removed
-    print(total_removed)
+    print(count_removable(grid, synchronous=False))
 
 
 def parse_grid(lines: list[str]) -> list[list[str]]:
@@ -0,0 +1,103 @@
+"""Incremental peeling of accessible paper rolls for Day 4, Part 2.
+
+Instead of rescanning the whole grid each round, the engine keeps every
+cell's count of adjacent rolls in a flat array. Removing a roll decrements
+its neighbors' counts, and only a neighbor whose count has just dropped
+below ``ADJACENT_THRESHOLD`` becomes a candidate for removal. Total work is
+O(cells + removals) instead of O(rounds x cells).
+
+Two schedules are offered. The round-synchronous schedule removes every
+accessible roll at once, exactly like repeated calls to
+``remove_accessible``. The asynchronous schedule removes rolls as soon as
+they become accessible. Removal only ever makes other rolls more
+accessible, so both schedules remove the same rolls in the end.
+"""
+
+ADJACENT_THRESHOLD: int = 4  # Rolls with fewer than this many adjacent are accessible
+ROLL: str = "@"
+
+
+def _flatten(grid: list[list[str]]) -> tuple[bytearray, int]:
+    """Flatten a grid into an occupancy array with a one-cell empty border.
+
+    :returns: The occupancy array and the padded row width.
+    """
+    width = max((len(row) for row in grid), default=0) + 2
+    occupied = bytearray(width * (len(grid) + 2))
+    for r, row in enumerate(grid, start=1):
+        for c, cell in enumerate(row, start=1):
+            if cell == ROLL:
+                occupied[r * width + c] = 1
+    return occupied, width
+
+
+def _release(
+    i: int,
+    occupied: bytearray,
+    counts: bytearray,
+    offsets: list[int],
+    accessible: list[int],
+) -> None:
+    """Decrement the counts around removed cell ``i``, queueing newly accessible rolls."""
+    for offset in offsets:
+        j = i + offset
+        if occupied[j]:
+            counts[j] -= 1
+            if counts[j] == ADJACENT_THRESHOLD - 1:
+                accessible.append(j)
+
+
+def count_removable(
+    grid: list[list[str]],
+    synchronous: bool = True,
+    round_counts: list[int] | None = None,
+) -> int:
+    """Count the rolls that can be removed by repeatedly removing accessible ones.
+
+    The grid is not modified.
+
+    :param grid: Grid of characters, ``"@"`` for a roll.
+    :param synchronous: Remove all accessible rolls in rounds (exact
+        ``remove_accessible`` semantics) rather than one at a time.
+    :param round_counts: If given, the number of rolls removed in each round
+        is appended to it. Only available with ``synchronous``.
+    :returns: Total number of rolls removed.
+    :raises ValueError: If ``round_counts`` is requested without ``synchronous``.
+
+    Examples:
+    >>> rounds: list[int] = []
+    >>> count_removable([list("@@@"), list("@@@"), list("@@@")], round_counts=rounds)
+    9
+    >>> rounds
+    [4, 4, 1]
+    >>> count_removable([list("@@@"), list("@@@"), list("@@@")], synchronous=False)
+    9
+    """
+    if round_counts is not None and not synchronous:
+        raise ValueError("Per-round counts need the synchronous schedule")
+    occupied, width = _flatten(grid)
+    offsets = [dr * width + dc for dr in (-1, 0, 1) for dc in (-1, 0, 1) if dr or dc]
+    rolls = [i for i, cell in enumerate(occupied) if cell]
+    counts = bytearray(len(occupied))
+    for i in rolls:
+        counts[i] = sum(occupied[i + offset] for offset in offsets)
+    frontier = [i for i in rolls if counts[i] < ADJACENT_THRESHOLD]
+    removed = 0
+    if not synchronous:
+        while frontier:
+            i = frontier.pop()
+            occupied[i] = 0
+            removed += 1
+            _release(i, occupied, counts, offsets, frontier)
+        return removed
+    while frontier:
+        for i in frontier:
+            occupied[i] = 0
+        candidates: list[int] = []
+        for i in frontier:
+            _release(i, occupied, counts, offsets, candidates)
+        removed += len(frontier)
+        if round_counts is not None:
+            round_counts.append(len(frontier))
+        frontier = candidates
+    return removed
@@ -0,0 +1,47 @@
+"""Tests for the day04 bit-packed grid."""
+
+import copy
+import random
+import sys
+
+from day04.bitgrid import BitGrid
+from day04.part1 import count_accessible_rolls
+from day04.part2 import remove_accessible
+
+
+def test_matches_list_grid() -> None:
+    """Test counts and per-round removals against the list-of-lists grid."""
+    rng = random.Random(20251214)
+    for _ in range(100):
+        rows = rng.randint(1, 15)
+        cols = rng.randint(1, 80)
+        grid = [[rng.choice("@@@.") for _ in range(cols)] for _ in range(rows)]
+        packed = BitGrid.from_lines("".join(row) for row in grid)
+        assert packed.count_accessible() == count_accessible_rolls(grid)
+        expected: list[int] = []
+        work = copy.deepcopy(grid)
+        while removed := remove_accessible(work):
+            expected.append(removed)
+        rounds: list[int] = []
+        assert packed.remove_all_accessible(rounds) == sum(expected)
+        assert rounds == expected
+        assert packed.rows == BitGrid.from_lines("".join(row) for row in work).rows
+
+
+def test_ragged_lines() -> None:
+    """Test that short lines are padded with empty cells."""
+    lines = ["@@@@", "@@", "@@@@"]
+    padded = [list(line.ljust(4, ".")) for line in lines]
+    grid = BitGrid.from_lines(lines)
+    assert grid.width == 4
+    assert grid.count_accessible() == count_accessible_rolls(padded)
+
+
+def test_memory_per_cell() -> None:
+    """Test that packed rows use at least 50x less memory than list-of-str rows."""
+    lines = ["@." * 5000] * 4
+    grid = BitGrid.from_lines(lines)
+    packed = sum(sys.getsizeof(row) for row in grid.rows)
+    unpacked = sum(sys.getsizeof(list(line)) for line in lines)
+    assert packed * 50 <= unpacked
+    assert grid.roll_count() == 4 * 5000
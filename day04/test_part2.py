@@ -21,7 +21,7 @@ def test_part2_example():
     with open("day04/test-input-part2.txt", "w") as f:
         f.write(input_data)
     result = subprocess.run(
-        ["uv", "run", "day04/part2.py", "day04/test-input-part2.txt"],
+        ["uv", "run", "python", "-m", "day04.part2", "day04/test-input-part2.txt"],
         check=False,
         capture_output=True,
         text=True,
@@ -0,0 +1,61 @@
+"""Tests for the day04 incremental peeling engine."""
+
+import copy
+import random
+
+import pytest
+
+from day04.part2 import remove_accessible
+from day04.peel import count_removable
+
+
+def _rounds_by_rescanning(grid: list[list[str]]) -> list[int]:
+    """Return per-round removal counts from the full-rescan loop."""
+    grid = copy.deepcopy(grid)
+    rounds: list[int] = []
+    while removed := remove_accessible(grid):
+        rounds.append(removed)
+    return rounds
+
+
+def test_matches_rescanning_loop() -> None:
+    """Test both schedules against the full-grid rescan on random grids."""
+    rng = random.Random(20251213)
+    for _ in range(100):
+        rows = rng.randint(1, 15)
+        cols = rng.randint(1, 15)
+        grid = [[rng.choice("@@@.") for _ in range(cols)] for _ in range(rows)]
+        expected = _rounds_by_rescanning(grid)
+        rounds: list[int] = []
+        assert count_removable(grid, round_counts=rounds) == sum(expected)
+        assert rounds == expected
+        assert count_removable(grid, synchronous=False) == sum(expected)
+
+
+def test_sample_grid() -> None:
+    """Test the sample grid from the puzzle description (43 rolls removed)."""
+    sample = [
+        list(row)
+        for row in [
+            "..@@.@@@@.",
+            "@@@.@.@.@@",
+            "@@@@@.@.@@",
+            "@.@@@@..@.",
+            "@@.@@@@.@@",
+            ".@@@@@@@.@",
+            ".@.@.@.@@@",
+            "@.@@@.@@@@",
+            ".@@@@@@@@.",
+            "@.@.@@@.@.",
+        ]
+    ]
+    rounds: list[int] = []
+    assert count_removable(sample, round_counts=rounds) == 43
+    assert rounds[0] == 13
+    assert count_removable(sample, synchronous=False) == 43
+
+
+def test_round_counts_need_synchronous() -> None:
+    """Test that per-round counts are rejected for the asynchronous schedule."""
+    with pytest.raises(ValueError, match="synchronous"):
+        count_removable([list("@")], synchronous=False, round_counts=[])
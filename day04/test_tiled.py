@@ -0,0 +1,54 @@
+"""Tests for the day04 tiled multi-process solver."""
+
+import copy
+import random
+from pathlib import Path
+
+from day04.part1 import count_accessible_rolls
+from day04.part2 import remove_accessible
+from day04.tiled import count_accessible_tiled, remove_all_accessible_tiled
+
+
+def test_matches_in_memory_solvers(tmp_path: Path) -> None:
+    """Test tiled results against the in-memory solvers for several band counts."""
+    rng = random.Random(20251215)
+    rows = 30
+    lines = [
+        "".join(rng.choice("@@@.") for _ in range(rng.randint(20, 25)))
+        for _ in range(rows)
+    ]
+    path = tmp_path / "grid.txt"
+    path.write_text("\n".join(lines) + "\n")
+    width = max(len(line) for line in lines)
+    grid = [list(line.ljust(width, ".")) for line in lines]
+    expected_rounds: list[int] = []
+    work = copy.deepcopy(grid)
+    while removed := remove_accessible(work):
+        expected_rounds.append(removed)
+    for workers in (1, 3, 7):
+        assert count_accessible_tiled(str(path), workers) == count_accessible_rolls(
+            grid
+        )
+        rounds: list[int] = []
+        assert remove_all_accessible_tiled(str(path), workers, rounds) == sum(
+            expected_rounds
+        )
+        assert rounds == expected_rounds
+
+
+def test_more_bands_than_rows(tmp_path: Path) -> None:
+    """Test that surplus workers with empty bands are harmless."""
+    path = tmp_path / "grid.txt"
+    path.write_text("@@@\n@@@\n@@@\n")
+    assert count_accessible_tiled(str(path), 8) == 4
+    assert remove_all_accessible_tiled(str(path), 8) == 9
+
+
+def test_empty_file(tmp_path: Path) -> None:
+    """Test that an empty grid file has nothing to count or remove."""
+    path = tmp_path / "grid.txt"
+    path.write_text("")
+    rounds: list[int] = []
+    assert count_accessible_tiled(str(path), 2) == 0
+    assert remove_all_accessible_tiled(str(path), 2, rounds) == 0
+    assert rounds == []
@@ -0,0 +1,58 @@
+"""Tests for the day04 NumPy grid backend."""
+
+import random
+
+import pytest
+
+from day04 import part1, vectorized
+
+
+def _count_with_loops(grid: list[list[str]], monkeypatch: pytest.MonkeyPatch) -> int:
+    """Count accessible rolls with the NumPy backend disabled."""
+    with monkeypatch.context() as m:
+        m.setattr(part1, "vectorized", None)
+        return part1.count_accessible_rolls(grid)
+
+
+def test_matches_cell_loops(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the vectorized count against the per-cell loops on random grids."""
+    rng = random.Random(20251212)
+    for _ in range(100):
+        rows = rng.randint(1, 12)
+        cols = rng.randint(1, 12)
+        grid = [[rng.choice("@@.") for _ in range(cols)] for _ in range(rows)]
+        expected_mask = [
+            [
+                grid[r][c] == "@"
+                and sum(
+                    grid[nr][nc] == "@"
+                    for nr in range(max(r - 1, 0), min(r + 2, rows))
+                    for nc in range(max(c - 1, 0), min(c + 2, cols))
+                )
+                - 1
+                < vectorized.ADJACENT_THRESHOLD
+                for c in range(cols)
+            ]
+            for r in range(rows)
+        ]
+        mask = vectorized.accessible_mask(
+            vectorized.occupancy(["".join(row) for row in grid])
+        )
+        assert mask.tolist() == expected_mask
+        assert part1.count_accessible_rolls(grid) == _count_with_loops(
+            grid, monkeypatch
+        )
+
+
+def test_ragged_rows_padded(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that ragged rows behave like ljust padding with empty cells."""
+    lines = ["@@@@", "@@", "@@@@"]
+    padded = [list(line.ljust(4, ".")) for line in lines]
+    assert vectorized.count_accessible(vectorized.occupancy(lines)) == (
+        _count_with_loops(padded, monkeypatch)
+    )
+
+
+def test_empty_grid() -> None:
+    """Test that an empty grid has no accessible rolls."""
+    assert vectorized.count_accessible(vectorized.occupancy([])) == 0
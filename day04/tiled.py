@@ -0,0 +1,229 @@
+"""Tiled, multi-process Day 4 solver for grids larger than memory.
+
+The input file is memory-mapped and cut at newline boundaries into row
+bands, one per worker process. Each worker reads only its own band and
+bit-packs it, so no process ever holds the text of the whole grid. Each
+band is surrounded by one halo row above and one below. The halos are
+copies of the neighboring bands' edge rows, which the coordinator exchanges
+before every round of the Part 2 removal loop. Results are identical to
+``count_accessible_rolls`` and the ``remove_accessible`` loop.
+
+Usage:
+    uv run python -m day04.tiled [--part2] [--workers N] input.txt
+"""
+
+import argparse
+import itertools
+import mmap
+import os
+from collections.abc import Iterator
+from multiprocessing import Pipe, Process
+from multiprocessing.connection import Connection
+
+from day04.bitgrid import BitGrid
+
+
+def _split_at_newlines(buf: mmap.mmap, start: int, end: int, parts: int) -> list[int]:
+    """Split ``buf[start:end]`` into roughly equal pieces ending at newlines.
+
+    :param buf: Memory-mapped file contents.
+    :param start: First byte of the region to split.
+    :param end: One past the last byte of the region.
+    :param parts: Desired number of pieces.
+    :returns: Sorted boundary offsets, beginning with ``start`` and ending with ``end``.
+    """
+    bounds = [start]
+    for i in range(1, parts):
+        target = start + (end - start) * i // parts
+        newline = buf.find(b"\n", max(target, bounds[-1]), end)
+        cut = end if newline == -1 else newline + 1
+        if cut > bounds[-1]:
+            bounds.append(cut)
+    if bounds[-1] != end:
+        bounds.append(end)
+    return bounds
+
+
+def _band_lines(path: str, start: int, end: int) -> Iterator[str]:
+    """Yield the non-blank lines stored in bytes ``start..end`` of a file, one at a time."""
+    with (
+        open(path, "rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf,
+    ):
+        buf.seek(start)
+        while buf.tell() < end:
+            line = buf.readline().rstrip(b"\r\n")
+            if line.strip():
+                yield line.decode()
+
+
+def _serve_band(conn: Connection, path: str, start: int, end: int) -> None:
+    """Worker loop that owns one band of rows plus its two halo rows.
+
+    The band is packed straight from the memory map, one line at a time, so
+    only its bit-packed rows are ever held. The worker reports its widest
+    line, receives the grid width, and then reports its row count and edge
+    rows. After that it answers ``"count"`` and ``"round"`` commands, each
+    carrying fresh halo rows, until ``"stop"``.
+    """
+    band = BitGrid.from_lines(_band_lines(path, start, end))
+    conn.send(band.width)
+    width: int = conn.recv()
+    rows = band.rows
+    height = len(rows)
+    rows.insert(0, 0)  # Halo rows above and below the band
+    rows.append(0)
+    grid = BitGrid(rows, width)
+    conn.send((height, grid.rows[1], grid.rows[height]) if height else (0, 0, 0))
+    dirty: set[int] = set(range(1, height + 1))
+    while True:
+        command, above, below = conn.recv()
+        if command == "stop":
+            break
+        if above != grid.rows[0]:
+            dirty.add(1)
+        if below != grid.rows[-1]:
+            dirty.add(height)
+        grid.rows[0], grid.rows[-1] = above, below
+        if command == "count":
+            rows = range(1, height + 1)
+            conn.send(sum(grid.accessible_bits(r).bit_count() for r in rows))
+            continue
+        removed, changed = grid.remove_round(dirty)
+        dirty = {r for r in changed if 1 <= r <= height}
+        conn.send((removed, grid.rows[1], grid.rows[height]))
+    conn.close()
+
+
+class _Bands:
+    """Coordinator for the band worker processes."""
+
+    def __init__(self, path: str, workers: int) -> None:
+        """Start one worker per band and agree on the grid width.
+
+        :param path: Path to the grid file.
+        :param workers: Desired number of bands (and processes).
+        """
+        size = os.path.getsize(path)
+        with (
+            open(path, "rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf,
+        ):
+            bounds = _split_at_newlines(buf, 0, size, workers)
+        self.conns: list[Connection] = []
+        self.procs: list[Process] = []
+        for start, end in itertools.pairwise(bounds):
+            parent, child = Pipe()
+            proc = Process(target=_serve_band, args=(child, path, start, end))
+            proc.start()
+            child.close()
+            self.conns.append(parent)
+            self.procs.append(proc)
+        width = max((conn.recv() for conn in self.conns), default=0)
+        for conn in self.conns:
+            conn.send(width)
+        self.edges: list[tuple[int, int]] = []
+        live: list[Connection] = []
+        for conn in self.conns:
+            height, first, last = conn.recv()
+            if height:
+                live.append(conn)
+                self.edges.append((first, last))
+            else:
+                conn.send(("stop", 0, 0))
+        self.live = live
+
+    def _send(self, command: str) -> None:
+        """Send a command with each band's current halo rows."""
+        for i, conn in enumerate(self.live):
+            above = self.edges[i - 1][1] if i > 0 else 0
+            below = self.edges[i + 1][0] if i + 1 < len(self.edges) else 0
+            conn.send((command, above, below))
+
+    def count(self) -> int:
+        """Count the accessible rolls across all bands."""
+        self._send("count")
+        return sum(conn.recv() for conn in self.live)
+
+    def remove_round(self) -> int:
+        """Run one synchronous removal round across all bands."""
+        self._send("round")
+        removed = 0
+        for i, conn in enumerate(self.live):
+            band_removed, first, last = conn.recv()
+            removed += band_removed
+            self.edges[i] = (first, last)
+        return removed
+
+    def close(self) -> None:
+        """Stop the worker processes."""
+        self._send("stop")
+        for conn in self.conns:
+            conn.close()
+        for proc in self.procs:
+            proc.join()
+
+
+def count_accessible_tiled(path: str, workers: int | None = None) -> int:
+    """Count accessible rolls in a grid file, one band per process.
+
+    :param path: Path to the grid file.
+    :param workers: Number of bands and processes; defaults to the CPU count.
+    :returns: The same count as ``count_accessible_rolls``.
+    """
+    if os.path.getsize(path) == 0:
+        return 0
+    bands = _Bands(path, workers or os.cpu_count() or 1)
+    try:
+        return bands.count()
+    finally:
+        bands.close()
+
+
+def remove_all_accessible_tiled(
+    path: str, workers: int | None = None, round_counts: list[int] | None = None
+) -> int:
+    """Remove accessible rolls in rounds, one band per process.
+
+    Edge rows are exchanged between neighboring bands after every round.
+
+    :param path: Path to the grid file.
+    :param workers: Number of bands and processes; defaults to the CPU count.
+    :param round_counts: If given, the number of rolls removed in each round
+        is appended to it.
+    :returns: The same total as repeating ``remove_accessible`` until it
+        removes nothing.
+    """
+    if os.path.getsize(path) == 0:
+        return 0
+    bands = _Bands(path, workers or os.cpu_count() or 1)
+    total = 0
+    try:
+        while removed := bands.remove_round():
+            total += removed
+            if round_counts is not None:
+                round_counts.append(removed)
+    finally:
+        bands.close()
+    return total
+
+
+def main() -> None:
+    """Run the tiled Day 4 solution."""
+    parser = argparse.ArgumentParser(
+        description="Solve Day 4 on a grid file using one process per row band."
+    )
+    parser.add_argument("input_file", help="grid file, one row per line")
+    parser.add_argument(
+        "--part2", action="store_true", help="remove accessible rolls in rounds"
+    )
+    parser.add_argument("--workers", type=int, default=None, help="worker processes")
+    args = parser.parse_args()
+    if args.part2:
+        print(remove_all_accessible_tiled(args.input_file, args.workers))
+    else:
+        print(count_accessible_tiled(args.input_file, args.workers))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""External-sort range merger for Day 5 inputs too large for memory.
+
+Ranges are parsed in runs that fit a memory budget. Each run is sorted and
+spilled to a temporary file as fixed-width little-endian ``int64`` pairs.
+The runs are then k-way merged with ``heapq.merge`` while overlapping and
+adjacent ranges are coalesced on the fly. Only one buffered block per run
+and the range being extended are held in memory during the merge. At most
+``MAX_FAN_IN`` run files are open at once. When there are more, groups of
+runs are first merged into longer intermediate runs, pass after pass. The
+fresh count equals ``count_fresh_ids`` on the same input.
+
+Usage:
+    uv run python -m day05.external [--memory MB] [--tmp-dir DIR] input.txt
+"""
+
+import argparse
+import heapq
+import os
+import struct
+import tempfile
+from collections.abc import Iterable, Iterator
+
+PAIR = struct.Struct("<qq")  # One range on disk: start, end
+MEMORY_BUDGET = 256 << 20  # Default bytes of ranges held in memory while sorting
+RANGE_COST = 128  # Approximate bytes one parsed range costs as a Python tuple
+READ_PAIRS = 4096  # Pairs read from a run file at a time during the merge
+MAX_FAN_IN = 64  # Run files open at once during a merge pass
+
+
+def parse_range_lines(lines: Iterable[bytes]) -> Iterator[tuple[int, int]]:
+    r"""Yield ``(start, end)`` for every line holding a range.
+
+    Like ``parse_ranges``, lines without a ``-`` (blank lines and IDs) are skipped.
+
+    Examples:
+    >>> list(parse_range_lines([b"3-5\n", b"\n", b"10-14\n", b"17\n"]))
+    [(3, 5), (10, 14)]
+    """
+    for line in lines:
+        if b"-" in line:
+            start, end = line.split(b"-")
+            yield int(start), int(end)
+
+
+def write_run(ranges: list[tuple[int, int]], path: str) -> None:
+    """Sort a batch of ranges and write them to ``path`` as packed pairs."""
+    ranges.sort()
+    with open(path, "wb") as f:
+        f.write(b"".join(PAIR.pack(start, end) for start, end in ranges))
+
+
+def write_pairs(pairs: Iterable[tuple[int, int]], path: str) -> None:
+    """Write a stream of pairs to ``path``, a block at a time."""
+    with open(path, "wb") as f:
+        block = bytearray()
+        for start, end in pairs:
+            block += PAIR.pack(start, end)
+            if len(block) >= PAIR.size * READ_PAIRS:
+                f.write(block)
+                block.clear()
+        f.write(block)
+
+
+def read_run(path: str) -> Iterator[tuple[int, int]]:
+    """Yield the pairs stored in a run file, reading a block at a time."""
+    with open(path, "rb") as f:
+        while block := f.read(PAIR.size * READ_PAIRS):
+            yield from PAIR.iter_unpack(block)
+
+
+def spill_runs(
+    ranges: Iterable[tuple[int, int]], run_dir: str, max_ranges: int
+) -> tuple[list[str], list[tuple[int, int]]]:
+    """Split ranges into sorted runs of at most ``max_ranges``.
+
+    Full runs are written to files in ``run_dir``. The final, partial run is
+    sorted and returned in memory instead of being written out.
+
+    :returns: The run file paths and the sorted in-memory tail.
+    """
+    paths: list[str] = []
+    batch: list[tuple[int, int]] = []
+    for pair in ranges:
+        batch.append(pair)
+        if len(batch) >= max_ranges:
+            path = os.path.join(run_dir, f"run{len(paths):06d}.bin")
+            write_run(batch, path)
+            paths.append(path)
+            batch = []
+    batch.sort()
+    return paths, batch
+
+
+def coalesce(ranges: Iterable[tuple[int, int]]) -> Iterator[tuple[int, int]]:
+    """Merge overlapping or adjacent ranges from a stream sorted by start.
+
+    Examples:
+    >>> list(coalesce([(3, 5), (6, 8), (10, 14), (12, 18), (16, 20)]))
+    [(3, 8), (10, 20)]
+    """
+    current: tuple[int, int] | None = None
+    for start, end in ranges:
+        if current is None:
+            current = (start, end)
+        elif start > current[1] + 1:
+            yield current
+            current = (start, end)
+        elif end > current[1]:
+            current = (current[0], end)
+    if current is not None:
+        yield current
+
+
+def merge_passes(paths: list[str], run_dir: str, fan_in: int = MAX_FAN_IN) -> list[str]:
+    """Merge run files in groups until at most ``fan_in`` remain.
+
+    Each group of ``fan_in`` runs is merged and coalesced into one new run
+    file, and the group's files are deleted.
+
+    :param paths: Sorted run files.
+    :param run_dir: Directory for the intermediate run files.
+    :param fan_in: Largest number of run files to open at once; at least 2.
+    :returns: The remaining run files.
+    """
+    merged_count = 0
+    while len(paths) > fan_in:
+        next_paths: list[str] = []
+        for group_start in range(0, len(paths), fan_in):
+            group = paths[group_start : group_start + fan_in]
+            if len(group) == 1:
+                next_paths += group
+                continue
+            path = os.path.join(run_dir, f"merged{merged_count:06d}.bin")
+            merged_count += 1
+            write_pairs(coalesce(heapq.merge(*(read_run(run) for run in group))), path)
+            for run in group:
+                os.remove(run)
+            next_paths.append(path)
+        paths = next_paths
+    return paths
+
+
+def count_fresh_external(
+    path: str,
+    memory_budget: int = MEMORY_BUDGET,
+    tmp_dir: str | None = None,
+    fan_in: int = MAX_FAN_IN,
+) -> int:
+    """Count the distinct fresh IDs in a puzzle file without loading every range.
+
+    :param path: Path to the puzzle input.
+    :param memory_budget: Approximate bytes of ranges to sort in memory at once.
+    :param tmp_dir: Directory for the run files; defaults to the system one.
+    :param fan_in: Largest number of run files open at once; at least 2.
+    :returns: The same total as ``count_fresh_ids``.
+    :raises struct.error: If a range bound does not fit in an ``int64``.
+    """
+    max_ranges = max(1, memory_budget // RANGE_COST)
+    with (
+        tempfile.TemporaryDirectory(dir=tmp_dir) as run_dir,
+        open(path, "rb") as f,
+    ):
+        paths, tail = spill_runs(parse_range_lines(f), run_dir, max_ranges)
+        paths = merge_passes(paths, run_dir, fan_in)
+        runs = [read_run(run) for run in paths]
+        merged = coalesce(heapq.merge(*runs, tail))
+        return sum(end - start + 1 for start, end in merged)
+
+
+def main() -> None:
+    """Run the external-sort Day 5 Part 2 solution."""
+    parser = argparse.ArgumentParser(
+        description="Count fresh ingredient IDs using an external merge sort."
+    )
+    parser.add_argument("input_file", help="puzzle input")
+    parser.add_argument(
+        "--memory",
+        type=int,
+        default=MEMORY_BUDGET >> 20,
+        help="memory budget for sorting, in MB (default: %(default)s)",
+    )
+    parser.add_argument("--tmp-dir", default=None, help="directory for run files")
+    args = parser.parse_args()
+    print(count_fresh_external(args.input_file, args.memory << 20, args.tmp_dir))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Mutable set of ingredient IDs stored as disjoint inclusive ranges.
+
+Ranges are kept merged in two parallel sorted lists of starts and ends, the
+same layout as ``IntervalIndex``. Adding or removing a range finds the
+affected ranges with two binary searches and splices them in one slice
+assignment. The number of covered IDs is updated from the lengths of just
+those ranges, so ``covered_count`` never rescans the set the way
+``count_fresh_ids`` does.
+"""
+
+import bisect
+from collections.abc import Iterable, Iterator
+
+
+class IntervalSet:
+    """Set of integers supporting range insertion, range deletion, and lookups."""
+
+    def __init__(self, ranges: Iterable[tuple[int, int]] = ()) -> None:
+        """Create a set holding the given inclusive ranges.
+
+        :param ranges: Initial ``(start, end)`` ranges; they may overlap.
+        """
+        self._starts: list[int] = []
+        self._ends: list[int] = []
+        self._covered = 0
+        for start, end in ranges:
+            self.add(start, end)
+
+    def __len__(self) -> int:
+        """Return the number of disjoint ranges in the set."""
+        return len(self._starts)
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        """Yield the disjoint ranges in increasing order."""
+        return zip(self._starts, self._ends, strict=True)
+
+    def __contains__(self, id_: int) -> bool:
+        """Check whether an ID is in the set."""
+        return self.contains(id_)
+
+    def contains(self, id_: int) -> bool:
+        """Check whether an ID is in the set.
+
+        :param id_: Ingredient ID.
+        :returns: True if some range covers the ID.
+        """
+        i = bisect.bisect_right(self._starts, id_) - 1
+        return i >= 0 and id_ <= self._ends[i]
+
+    def covered_count(self) -> int:
+        """Return the number of distinct IDs in the set."""
+        return self._covered
+
+    def add(self, start: int, end: int) -> None:
+        """Add every ID in ``start..end``, merging with overlapping or adjacent ranges.
+
+        :param start: First ID of the range.
+        :param end: Last ID of the range, inclusive.
+        :raises ValueError: If ``start`` is greater than ``end``.
+
+        Examples:
+        >>> ids = IntervalSet([(3, 5), (10, 14)])
+        >>> ids.add(6, 9)
+        >>> list(ids), ids.covered_count()
+        ([(3, 14)], 12)
+        """
+        _check_range(start, end)
+        lo = bisect.bisect_left(self._ends, start - 1)
+        hi = bisect.bisect_right(self._starts, end + 1)
+        if lo < hi:
+            start = min(start, self._starts[lo])
+            end = max(end, self._ends[hi - 1])
+            self._covered -= self._span(lo, hi)
+        self._starts[lo:hi] = [start]
+        self._ends[lo:hi] = [end]
+        self._covered += end - start + 1
+
+    def remove(self, start: int, end: int) -> None:
+        """Remove every ID in ``start..end``, splitting ranges that stick out.
+
+        :param start: First ID to remove.
+        :param end: Last ID to remove, inclusive.
+        :raises ValueError: If ``start`` is greater than ``end``.
+
+        Examples:
+        >>> ids = IntervalSet([(3, 5), (10, 20)])
+        >>> ids.remove(5, 12)
+        >>> list(ids), ids.covered_count()
+        ([(3, 4), (13, 20)], 10)
+        """
+        _check_range(start, end)
+        lo = bisect.bisect_left(self._ends, start)
+        hi = bisect.bisect_right(self._starts, end)
+        if lo >= hi:
+            return
+        starts: list[int] = []
+        ends: list[int] = []
+        if self._starts[lo] < start:
+            starts.append(self._starts[lo])
+            ends.append(start - 1)
+        if self._ends[hi - 1] > end:
+            starts.append(end + 1)
+            ends.append(self._ends[hi - 1])
+        self._covered -= self._span(lo, hi)
+        self._covered += sum(e - s + 1 for s, e in zip(starts, ends, strict=True))
+        self._starts[lo:hi] = starts
+        self._ends[lo:hi] = ends
+
+    def _span(self, lo: int, hi: int) -> int:
+        """Return the number of IDs covered by ranges ``lo`` to ``hi - 1``."""
+        return sum(self._ends[lo:hi]) - sum(self._starts[lo:hi]) + hi - lo
+
+
+def _check_range(start: int, end: int) -> None:
+    """Reject a range whose start comes after its end."""
+    if start > end:
+        raise ValueError(f"Range start {start} is greater than end {end}")
@@ -0,0 +1,131 @@
+"""Streaming fresh-ID counter for Day 5.
+
+Only the range section is held in memory. After the blank line, IDs are
+read from a buffered binary stream in batches of about ``BATCH_BYTES``
+bytes. Each batch is answered with ``IntervalIndex.contains_many`` and then
+dropped, so memory stays flat however many IDs follow. The input may be
+a file or standard input, which lets the counter sit in a Unix pipeline.
+
+Usage:
+    uv run python -m day05.stream [--progress] [input.txt]
+    generate-ids | uv run python -m day05.stream --ranges ranges.txt
+"""
+
+import argparse
+import sys
+from typing import BinaryIO, TextIO
+
+from day05.index import IntervalIndex
+
+BATCH_BYTES = 1 << 20  # Approximate size of one batch of ID lines
+
+
+def read_ranges(stream: BinaryIO) -> list[tuple[int, int]]:
+    r"""Read ``start-end`` lines up to the first blank line or the end of input.
+
+    The stream is left positioned after the blank line.
+
+    Examples:
+    >>> import io
+    >>> stream = io.BytesIO(b"3-5\n10-14\n\n1\n")
+    >>> read_ranges(stream), stream.read()
+    ([(3, 5), (10, 14)], b'1\n')
+    """
+    ranges: list[tuple[int, int]] = []
+    for line in stream:
+        if not line.strip():
+            break
+        if b"-" in line:
+            start, end = line.split(b"-")
+            ranges.append((int(start), int(end)))
+    return ranges
+
+
+def count_fresh_stream(
+    stream: BinaryIO,
+    index: IntervalIndex,
+    batch_bytes: int = BATCH_BYTES,
+    progress: TextIO | None = None,
+) -> int:
+    r"""Count the fresh IDs in a stream of ID lines, one batch at a time.
+
+    :param stream: Binary stream of IDs, one per line; blank lines are skipped.
+    :param index: Index of the fresh ranges.
+    :param batch_bytes: Approximate number of bytes read per batch.
+    :param progress: Stream for running ID and fresh counts, if any.
+    :returns: Number of IDs that lie in some range.
+
+    Examples:
+    >>> import io
+    >>> index = IntervalIndex([(3, 5), (10, 14), (16, 20), (12, 18)])
+    >>> count_fresh_stream(io.BytesIO(b"1\n5\n8\n11\n17\n32\n"), index)
+    3
+    """
+    seen = fresh = 0
+    while batch := stream.readlines(batch_bytes):
+        ids = [int(line) for line in batch if line.strip()]
+        seen += len(ids)
+        fresh += sum(index.contains_many(ids))
+        if progress is not None:
+            progress.write(f"\r{seen} ids, {fresh} fresh")
+            progress.flush()
+    if progress is not None:
+        progress.write("\n")
+    return fresh
+
+
+def count_fresh(
+    stream: BinaryIO, batch_bytes: int = BATCH_BYTES, progress: TextIO | None = None
+) -> int:
+    r"""Count the fresh IDs in a complete puzzle input stream.
+
+    :param stream: Binary stream with the ranges, a blank line, and the IDs.
+    :param batch_bytes: Approximate number of bytes read per batch of IDs.
+    :param progress: Stream for running ID and fresh counts, if any.
+    :returns: Number of fresh IDs.
+
+    Examples:
+    >>> import io
+    >>> count_fresh(io.BytesIO(b"3-5\n10-14\n16-20\n12-18\n\n1\n5\n8\n11\n17\n32\n"))
+    3
+    """
+    index = IntervalIndex(read_ranges(stream))
+    return count_fresh_stream(stream, index, batch_bytes, progress)
+
+
+def _run(stream: BinaryIO, index: IntervalIndex | None, progress: TextIO | None) -> int:
+    """Count fresh IDs, reading the ranges from the stream unless already given."""
+    if index is None:
+        return count_fresh(stream, progress=progress)
+    return count_fresh_stream(stream, index, progress=progress)
+
+
+def main() -> None:
+    """Count fresh IDs from a file or standard input."""
+    parser = argparse.ArgumentParser(
+        description="Count fresh ingredient IDs while streaming the ID list."
+    )
+    parser.add_argument(
+        "input_file", nargs="?", default="-", help="puzzle input, or - for stdin"
+    )
+    parser.add_argument(
+        "--ranges", help="read the ranges from this file and only IDs from the input"
+    )
+    parser.add_argument(
+        "--progress", action="store_true", help="report running counts on stderr"
+    )
+    args = parser.parse_args()
+    progress = sys.stderr if args.progress else None
+    index = None
+    if args.ranges is not None:
+        with open(args.ranges, "rb") as f:
+            index = IntervalIndex(read_ranges(f))
+    if args.input_file == "-":
+        print(_run(sys.stdin.buffer, index, progress))
+    else:
+        with open(args.input_file, "rb") as f:
+            print(_run(f, index, progress))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Tests for the day05 external-sort range merger."""
+
+import random
+from pathlib import Path
+
+from day05.external import (
+    RANGE_COST,
+    count_fresh_external,
+    merge_passes,
+    read_run,
+    spill_runs,
+)
+from day05.part2 import count_fresh_ids
+
+
+def test_matches_in_memory_count(tmp_path: Path) -> None:
+    """Test several memory budgets against ``count_fresh_ids``."""
+    rng = random.Random(16)
+    ranges: list[tuple[int, int]] = []
+    for _ in range(500):
+        start = rng.randint(-1000, 10**12)
+        ranges.append((start, start + rng.randint(0, 10**9)))
+    ranges += [(5, 5), (6, 9), (10, 10)]
+    puzzle = tmp_path / "input.txt"
+    text = "".join(f"{lo}-{hi}\n" for lo, hi in ranges) + "\n1\n42\n"
+    puzzle.write_text(text)
+    run_dir = tmp_path / "runs"
+    run_dir.mkdir()
+    expected = count_fresh_ids(list(ranges))
+    for budget in (RANGE_COST, RANGE_COST * 7, 1 << 30):
+        assert count_fresh_external(str(puzzle), budget, str(run_dir)) == expected
+    assert not any(run_dir.iterdir())
+
+
+def test_spill_runs_are_sorted(tmp_path: Path) -> None:
+    """Test that full runs are written sorted and the tail stays in memory."""
+    ranges = [(9, 9), (1, 2), (5, 6), (3, 4), (0, 0)]
+    paths, tail = spill_runs(ranges, str(tmp_path), 2)
+    assert [list(read_run(path)) for path in paths] == [
+        [(1, 2), (9, 9)],
+        [(3, 4), (5, 6)],
+    ]
+    assert tail == [(0, 0)]
+
+
+def test_empty_input(tmp_path: Path) -> None:
+    """Test a file with no ranges."""
+    puzzle = tmp_path / "input.txt"
+    puzzle.write_text("")
+    assert count_fresh_external(str(puzzle)) == 0
+
+
+def test_multiple_merge_passes(tmp_path: Path) -> None:
+    """Test a run count that needs several merge passes at a small fan-in."""
+    rng = random.Random(161)
+    ranges = [(lo, lo + rng.randint(0, 50)) for lo in rng.sample(range(100_000), 3000)]
+    puzzle = tmp_path / "input.txt"
+    puzzle.write_text("".join(f"{lo}-{hi}\n" for lo, hi in ranges))
+    run_dir = tmp_path / "runs"
+    run_dir.mkdir()
+    paths, _ = spill_runs(ranges, str(run_dir), 10)
+    assert len(merge_passes(paths, str(run_dir), 4)) <= 4
+    expected = count_fresh_ids(list(ranges))
+    assert (
+        count_fresh_external(str(puzzle), RANGE_COST * 10, str(run_dir), 4) == expected
+    )
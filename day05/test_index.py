@@ -0,0 +1,52 @@
+"""Tests for the day05 interval index."""
+
+import random
+
+import pytest
+
+from day05 import index as index_module
+from day05.index import IntervalIndex
+
+
+def _random_ranges(rng: random.Random, count: int) -> list[tuple[int, int]]:
+    ranges: list[tuple[int, int]] = []
+    for _ in range(count):
+        start = rng.randint(0, 500)
+        ranges.append((start, start + rng.randint(0, 30)))
+    return ranges
+
+
+def test_matches_linear_scan() -> None:
+    """Test lookups against checking every range."""
+    rng = random.Random(5)
+    for _ in range(50):
+        ranges = _random_ranges(rng, rng.randint(0, 20))
+        index = IntervalIndex(ranges)
+        ids = [rng.randint(-5, 540) for _ in range(100)]
+        expected = [any(lo <= id_ <= hi for lo, hi in ranges) for id_ in ids]
+        assert [index.contains(id_) for id_ in ids] == expected
+        assert index.contains_many(ids) == expected
+        covered = {i for lo, hi in ranges for i in range(lo, hi + 1)}
+        assert index.total_covered() == len(covered)
+
+
+def test_contains_many_without_numpy(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the pure Python batch path."""
+    monkeypatch.setattr(index_module, "vectorized", None)
+    index = IntervalIndex([(3, 5), (10, 14), (16, 20), (12, 18)])
+    assert index.contains_many([1, 5, 8, 11, 17, 32]) == [
+        False,
+        True,
+        False,
+        True,
+        True,
+        False,
+    ]
+
+
+def test_ids_beyond_int64() -> None:
+    """Test that IDs too large for NumPy still get answered."""
+    big = 1 << 70
+    index = IntervalIndex([(big, big + 10), (1, 2)])
+    assert index.contains_many([big + 5, big + 11, 2]) == [True, False, True]
+    assert len(index) == 2
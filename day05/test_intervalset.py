@@ -0,0 +1,43 @@
+"""Tests for the day05 mutable interval set."""
+
+import random
+
+import pytest
+
+from day05.intervalset import IntervalSet
+from day05.part2 import count_fresh_ids, merge_ranges
+
+
+def test_random_operations_match_python_set() -> None:
+    """Test a random sequence of adds and removes against a plain set of IDs."""
+    rng = random.Random(15)
+    ids = IntervalSet()
+    reference: set[int] = set()
+    for _ in range(2000):
+        start = rng.randint(0, 300)
+        end = start + rng.randint(0, 25)
+        if rng.random() < 0.6:
+            ids.add(start, end)
+            reference.update(range(start, end + 1))
+        else:
+            ids.remove(start, end)
+            reference.difference_update(range(start, end + 1))
+        assert ids.covered_count() == len(reference)
+    assert [i for i in range(-1, 330) if i in ids] == sorted(reference)
+    assert list(ids) == merge_ranges([(i, i) for i in reference])
+
+
+def test_matches_count_fresh_ids() -> None:
+    """Test the example ranges against the Part 2 counter."""
+    ranges = [(3, 5), (10, 14), (16, 20), (12, 18)]
+    ids = IntervalSet(ranges)
+    assert ids.covered_count() == count_fresh_ids(list(ranges)) == 14
+    assert len(ids) == 2
+    assert ids.contains(16)
+    assert not ids.contains(9)
+
+
+def test_rejects_reversed_range() -> None:
+    """Test that a range with start after end is an error."""
+    with pytest.raises(ValueError, match="greater than end"):
+        IntervalSet().add(5, 3)
@@ -0,0 +1,47 @@
+"""Tests for the day05 streaming fresh-ID counter."""
+
+import io
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+from day05.index import IntervalIndex
+from day05.stream import count_fresh, count_fresh_stream, read_ranges
+
+EXAMPLE = b"3-5\n10-14\n16-20\n12-18\n\n1\n5\n8\n11\n17\n32\n"
+
+
+def test_small_batches_match_index() -> None:
+    """Test that tiny batches give the same count as one big lookup."""
+    rng = random.Random(14)
+    ranges = [(lo, lo + rng.randint(0, 40)) for lo in rng.sample(range(1000), 30)]
+    ids = [rng.randint(0, 1100) for _ in range(2000)]
+    text = "".join(f"{lo}-{hi}\n" for lo, hi in ranges) + "\n"
+    text += "".join(f"{id_}\n" for id_ in ids)
+    expected = sum(IntervalIndex(ranges).contains_many(ids))
+    for batch_bytes in (1, 7, 1 << 20):
+        assert count_fresh(io.BytesIO(text.encode()), batch_bytes) == expected
+
+
+def test_progress_and_blank_lines() -> None:
+    """Test running counts on the progress stream and skipped blank lines."""
+    stream = io.BytesIO(EXAMPLE.replace(b"\n8\n", b"\n\n8\r\n"))
+    index = IntervalIndex(read_ranges(stream))
+    progress = io.StringIO()
+    assert count_fresh_stream(stream, index, progress=progress) == 3
+    assert progress.getvalue().endswith("6 ids, 3 fresh\n")
+
+
+def test_ids_from_stdin(tmp_path: Path) -> None:
+    """Test piping IDs on stdin with the ranges in a separate file."""
+    ranges = tmp_path / "ranges.txt"
+    ranges.write_bytes(EXAMPLE.split(b"\n\n")[0])
+    ids = EXAMPLE.split(b"\n\n")[1]
+    result = subprocess.run(
+        [sys.executable, "-m", "day05.stream", "--ranges", str(ranges)],
+        input=ids,
+        capture_output=True,
+        check=True,
+    )
+    assert result.stdout == b"3\n"
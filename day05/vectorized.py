@@ -0,0 +1,61 @@
+"""NumPy backend for Day 5 interval lookups.
+
+The merged range starts and ends are converted to ``int64`` arrays once,
+when the index is built. Each batch of IDs is then answered with one
+``searchsorted`` over the starts followed by a comparison against the
+matching ends.
+``IntervalIndex.contains_many`` uses this backend automatically when NumPy
+is installed.
+"""
+
+from collections.abc import Sequence
+from typing import Self
+
+import numpy as np
+from numpy.typing import NDArray
+
+
+class RangeArrays:
+    """Sorted, disjoint inclusive ranges held as ``int64`` start and end arrays."""
+
+    def __init__(self, lo: NDArray[np.int64], hi: NDArray[np.int64]) -> None:
+        """Wrap parallel start and end arrays; use ``build`` to convert lists."""
+        self.lo = lo
+        self.hi = hi
+
+    @classmethod
+    def build(cls, starts: Sequence[int], ends: Sequence[int]) -> Self | None:
+        """Convert range starts and ends once, for reuse across batches.
+
+        :param starts: Range starts in increasing order.
+        :param ends: Range ends, parallel to ``starts``.
+        :returns: The arrays, or ``None`` if a bound does not fit in an ``int64``.
+        """
+        try:
+            return cls(
+                np.asarray(starts, dtype=np.int64), np.asarray(ends, dtype=np.int64)
+            )
+        except OverflowError:
+            return None
+
+    def contains_many(self, ids: Sequence[int]) -> list[bool] | None:
+        """Test a batch of IDs against the ranges.
+
+        :param ids: IDs to look up.
+        :returns: Whether each ID lies in some range, or ``None`` if an ID does
+            not fit in an ``int64`` and the pure Python path is needed.
+
+        Examples:
+        >>> arrays = RangeArrays.build([3, 10], [5, 20])
+        >>> arrays is not None and arrays.contains_many([1, 5, 8, 11, 32])
+        [False, True, False, True, False]
+        """
+        if not len(self.lo):
+            return [False] * len(ids)
+        try:
+            values = np.asarray(ids, dtype=np.int64)
+        except OverflowError:
+            return None
+        slot = np.searchsorted(self.lo, values, side="right") - 1
+        inside = (slot >= 0) & (values <= self.hi[np.maximum(slot, 0)])
+        return inside.tolist()
@@ -1,51 +1,48 @@
-"""Day 6 - Part 1 Solution: Solve worksheet by reading numbers vertically in each problem group."""
-
-
-def solve(input_lines: list[str]) -> int:
-    """Solve the worksheet for part 1 rules."""
-    rows: list[str] = [line.rstrip("\n") for line in input_lines]
-    if not rows:
-        return 0
-    n_rows: int = len(rows)
-    n_cols: int = max(len(row) for row in rows)
-    # Pad all rows to the same length
-    rows = [row.ljust(n_cols) for row in rows]
-    problems: list[tuple[list[int], str]] = []
-    col: int = 0
-    while col < n_cols:
-        # Find the start of a problem (not all spaces in the number rows)
-        if all(rows[r][col] == " " for r in range(n_rows - 1)):
-            col += 1
-            continue
-        # Collect columns for this problem until we hit a full space column
-        problem_cols: list[int] = []
-        while col < n_cols and not all(rows[r][col] == " " for r in range(n_rows - 1)):
-            problem_cols.append(col)
-            col += 1
-        # Extract numbers and operator
-        numbers: list[int] = []
-        for r in range(n_rows - 1):
-            num_str: str = "".join(rows[r][c] for c in problem_cols).strip()
-            if num_str:
-                numbers.append(int(num_str))
-        op: str = "".join(rows[n_rows - 1][c] for c in problem_cols).strip()
-        problems.append((numbers, op))
-    # Now solve each problem
-    total: int = 0
-    for numbers, op in problems:
-        if op == "+":
-            total += sum(numbers)
-        elif op == "*":
-            prod: int = 1
-            for n in numbers:
-                prod *= n
-            total += prod
-        else:
-            raise ValueError(f"Unknown operator: {op}")
-    return total
+"""Day 6 - Part 1 Solution: Solve worksheet by reading numbers vertically in each problem group.
 
+Usage:
+    uv run python -m day06.part1 [--workers N] [input.txt]
+"""
 
-if __name__ == "__main__":
-    with open("input.txt") as f:
+import argparse
+import os
+
+from day06.worksheet import evaluate_all, parse_problems, row_numbers
+
+
+def solve(input_lines: list[str], workers: int = 1) -> int:
+    """Solve the worksheet for part 1 rules.
+
+    :param input_lines: Worksheet lines; the last holds the operators.
+    :param workers: Number of processes to evaluate problems with.
+    :returns: The grand total of all problems.
+    """
+    return evaluate_all(
+        (
+            (row_numbers(problem.block), problem.op)
+            for problem in parse_problems(input_lines)
+        ),
+        workers,
+    )
+
+
+def main() -> None:
+    """Read a worksheet and print its Part 1 grand total."""
+    parser = argparse.ArgumentParser(description="Solve the Day 6 worksheet (Part 1).")
+    parser.add_argument(
+        "input_file",
+        nargs="?",
+        default=os.path.join(os.path.dirname(__file__), "input.txt"),
+        help="worksheet file (default: input.txt next to this module)",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=1, help="processes to evaluate problems with"
+    )
+    args = parser.parse_args()
+    with open(args.input_file) as f:
         input_lines = f.read().splitlines()
-    print(solve(input_lines))
+    print(solve(input_lines, args.workers))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Streaming, column-window evaluator for very wide Day 6 worksheets.
+
+The worksheet file is memory-mapped. After one pass that records where
+each line starts and ends, every row is read in lockstep, ``BLOCK_SIZE``
+columns at a time. Separator columns are found per block with the shared
+``occupied_columns`` reduction. A problem's column slices are collected only
+until its trailing separator is seen, and then the problem is evaluated and
+dropped. Memory therefore scales with the number of rows times one block or
+one problem, whichever is wider, and not with the width of the sheet.
+
+Usage:
+    uv run python -m day06.stream [--part2] [--block-size N] input.txt
+"""
+
+import argparse
+import mmap
+from collections.abc import Callable, Sequence
+
+from day06.worksheet import (
+    column_numbers,
+    evaluate,
+    occupied_columns,
+    problem_spans,
+    row_numbers,
+)
+
+BLOCK_SIZE = 1 << 16  # Columns read from every row at a time
+
+type Reader = Callable[[Sequence[bytes]], list[int]]
+
+
+def line_bounds(buf: mmap.mmap) -> list[tuple[int, int]]:
+    """Return the ``(start, end)`` byte offsets of every line, without newlines.
+
+    A final newline does not start an extra empty line, as with ``splitlines``.
+    """
+    bounds: list[tuple[int, int]] = []
+    start = 0
+    size = len(buf)
+    while start < size:
+        end = buf.find(b"\n", start)
+        if end < 0:
+            end = size
+        bounds.append((start, end))
+        start = end + 1
+    return bounds
+
+
+class _Pending:
+    """Column slices of the problem currently being read, one per row."""
+
+    def __init__(self, rows: int) -> None:
+        self.parts: list[bytearray] = [bytearray() for _ in range(rows)]
+        self.open = False
+
+    def extend(self, chunks: Sequence[bytes], start: int, stop: int) -> None:
+        """Append columns ``start..stop`` of the current block."""
+        for part, chunk in zip(self.parts, chunks, strict=True):
+            part.extend(chunk[start:stop])
+        self.open = True
+
+    def flush(self, reader: Reader) -> int:
+        """Evaluate the collected problem and start an empty one."""
+        *block, ops = (bytes(part) for part in self.parts)
+        for part in self.parts:
+            part.clear()
+        self.open = False
+        return evaluate(reader(block), ops.strip().decode())
+
+
+def solve_file(path: str, reader: Reader, block_size: int = BLOCK_SIZE) -> int:
+    """Evaluate a worksheet file block by block and return the grand total.
+
+    :param path: Path to the worksheet; the last line holds the operators.
+    :param reader: ``row_numbers`` for Part 1 or ``column_numbers`` for Part 2.
+    :param block_size: Number of columns read from every row at a time.
+    :returns: The same total as the in-memory ``solve`` for the chosen part.
+    """
+    with open(path, "rb") as f:
+        if not f.seek(0, 2):
+            return 0
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            bounds = line_bounds(buf)
+            width = max(end - start for start, end in bounds)
+            pending = _Pending(len(bounds))
+            total = 0
+            for col in range(0, width, block_size):
+                size = min(block_size, width - col)
+                chunks = [
+                    buf[start + col : min(start + col + size, end)].ljust(size)
+                    for start, end in bounds
+                ]
+                spans = problem_spans(occupied_columns(chunks[:-1]))
+                if pending.open and (not spans or spans[0][0] > 0):
+                    total += pending.flush(reader)
+                for start, stop in spans:
+                    pending.extend(chunks, start, stop)
+                    if stop < size:
+                        total += pending.flush(reader)
+            if pending.open:
+                total += pending.flush(reader)
+    return total
+
+
+def main() -> None:
+    """Run the streaming Day 6 solution."""
+    parser = argparse.ArgumentParser(
+        description="Evaluate a wide worksheet a block of columns at a time."
+    )
+    parser.add_argument("input_file", help="worksheet file")
+    parser.add_argument(
+        "--part2", action="store_true", help="read numbers column by column"
+    )
+    parser.add_argument(
+        "--block-size",
+        type=int,
+        default=BLOCK_SIZE,
+        help="columns per block (default: %(default)s)",
+    )
+    args = parser.parse_args()
+    reader = column_numbers if args.part2 else row_numbers
+    print(solve_file(args.input_file, reader, args.block_size))
+
+
+if __name__ == "__main__":
+    main()
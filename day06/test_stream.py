@@ -0,0 +1,53 @@
+"""Tests for the day06 streaming worksheet evaluator."""
+
+import random
+from pathlib import Path
+
+from day06 import part1, part2
+from day06.stream import solve_file
+from day06.worksheet import column_numbers, row_numbers
+
+
+def _random_worksheet(rng: random.Random) -> list[str]:
+    """Build a ragged worksheet of random problems with varied separators."""
+    rows = rng.randint(1, 4)
+    lines = [""] * (rows + 1)
+    for _ in range(rng.randint(1, 12)):
+        width = rng.randint(1, 4)
+        for r in range(rows):
+            # The first row spans the whole problem so the operator sits under it
+            digits = str(rng.randint(10 ** (width - 1) if r == 0 else 1, 10**width - 1))
+            lines[r] += (
+                digits.rjust(width) if rng.random() < 0.5 else digits.ljust(width)
+            )
+        lines[rows] += rng.choice("+*").ljust(width)
+        gap = " " * rng.randint(1, 3)
+        lines = [line + gap for line in lines]
+    return [line.rstrip() if rng.random() < 0.5 else line for line in lines]
+
+
+def test_matches_in_memory_solvers(tmp_path: Path) -> None:
+    """Test random worksheets at several block sizes against both parts."""
+    rng = random.Random(18)
+    path = tmp_path / "worksheet.txt"
+    for _ in range(100):
+        lines = _random_worksheet(rng)
+        path.write_text("\n".join(lines) + "\n")
+        for block_size in (1, 2, 5, 1000):
+            assert solve_file(str(path), row_numbers, block_size) == part1.solve(lines)
+            assert solve_file(str(path), column_numbers, block_size) == part2.solve(
+                lines
+            )
+
+
+def test_real_input() -> None:
+    """Test the real input against the known answers."""
+    assert solve_file("day06/input.txt", row_numbers, 7) == 5381996914800
+    assert solve_file("day06/input.txt", column_numbers, 7) == 9627174150897
+
+
+def test_empty_file(tmp_path: Path) -> None:
+    """Test that an empty worksheet totals zero."""
+    path = tmp_path / "worksheet.txt"
+    path.write_text("")
+    assert solve_file(str(path), row_numbers) == 0
@@ -0,0 +1,67 @@
+"""Tests for the day06 columnar worksheet parser."""
+
+import math
+import random
+from collections.abc import Sequence
+
+import pytest
+
+from day06 import part1, part2
+from day06.worksheet import (
+    OPERATORS,
+    Problem,
+    column_numbers,
+    evaluate,
+    evaluate_all,
+    parse_problems,
+    product_tree,
+    row_numbers,
+)
+
+
+def test_ragged_lines_and_blank_columns() -> None:
+    """Test short lines, leading separators, and operators under separators."""
+    lines = ["  12   7\n", "  3", "   4   88", "  *  + +"]
+    problems = parse_problems(lines)
+    assert problems == [
+        Problem([b"12", b"3 ", b" 4"], "*"),
+        Problem([b"7 ", b"  ", b"88"], "+"),
+    ]
+    assert [row_numbers(p.block) for p in problems] == [[12, 3, 4], [7, 88]]
+    assert [column_numbers(p.block) for p in problems] == [[13, 24], [78, 8]]
+
+
+def test_empty_worksheets() -> None:
+    """Test inputs without any number rows."""
+    assert parse_problems([]) == []
+    assert parse_problems(["*  +"]) == []
+
+
+def test_product_tree_matches_sequential_product() -> None:
+    """Test the balanced product against a left-to-right product."""
+    rng = random.Random(19)
+    for count in range(20):
+        numbers = [rng.randint(0, 10**30) for _ in range(count)]
+        assert product_tree(numbers) == math.prod(numbers)
+
+
+def test_operator_table_and_unknown_operator() -> None:
+    """Test a custom operator table and the error for a missing operator."""
+    operators = {**OPERATORS, "-": _difference}
+    assert evaluate_all([([10, 3], "-"), ([2, 2], "*")], 1, operators) == 11
+    with pytest.raises(ValueError, match="Unknown operator: -"):
+        evaluate([10, 3], "-")
+
+
+def test_parallel_matches_serial() -> None:
+    """Test evaluation across processes against the serial sum."""
+    with open("day06/input.txt") as f:
+        lines = f.read().splitlines()
+    assert part1.solve(lines, workers=3) == part1.solve(lines) == 5381996914800
+    assert part2.solve(lines, workers=2) == 9627174150897
+    assert evaluate_all([], workers=2) == 0
+
+
+def _difference(numbers: Sequence[int]) -> int:
+    """Subtract the remaining numbers from the first one."""
+    return numbers[0] - sum(numbers[1:])
@@ -0,0 +1,180 @@
+r"""Shared columnar parser for the Day 6 worksheet.
+
+The worksheet is padded once into equal-width byte rows. Separator columns
+are found in a single reduction: each number row is translated to 0/1 bytes
+(space or not), read as one big integer, and the rows are ORed together.
+Zero bytes in the result are columns that are blank in every number row.
+The maximal runs of non-zero bytes are the problems' column spans. Each
+problem is then just a slice of every row, and the Part 1 (row-wise) and
+Part 2 (column-wise) readers work on those slices.
+
+Examples:
+>>> lines = ["123 328", " 45 64 ", "*   +  "]
+>>> [(row_numbers(p.block), p.op) for p in parse_problems(lines)]
+[([123, 45], '*'), ([328, 64], '+')]
+>>> [column_numbers(p.block) for p in parse_problems(lines)]
+[[1, 24, 35], [36, 24, 8]]
+"""
+
+import re
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import NamedTuple
+
+_OCCUPIED = bytes(0 if b == ord(" ") else 1 for b in range(256))
+_SPAN = re.compile(rb"[^\x00]+")
+
+
+class Problem(NamedTuple):
+    """One worksheet problem: its slice of the number rows and its operator."""
+
+    block: list[bytes]
+    op: str
+
+
+def pad_rows(input_lines: Sequence[str]) -> list[bytes]:
+    """Encode the worksheet lines as byte rows padded with spaces to equal width."""
+    rows = [line.rstrip("\n").encode() for line in input_lines]
+    width = max((len(row) for row in rows), default=0)
+    return [row.ljust(width) for row in rows]
+
+
+def occupied_columns(rows: Sequence[bytes]) -> bytes:
+    """Mark the columns that hold a non-space byte in any of the given rows.
+
+    :param rows: Equal-width byte rows.
+    :returns: One byte per column, 1 where some row is not a space, else 0.
+
+    Examples:
+    >>> list(occupied_columns([b"12  3", b" 4  5"]))
+    [1, 1, 0, 0, 1]
+    """
+    if not rows:
+        return b""
+    width = len(rows[0])
+    mask = 0
+    for row in rows:
+        mask |= int.from_bytes(row.translate(_OCCUPIED))
+    return mask.to_bytes(width)
+
+
+def problem_spans(mask: bytes) -> list[tuple[int, int]]:
+    """Return the ``(start, stop)`` column spans between separator columns.
+
+    Examples:
+    >>> problem_spans(bytes([0, 1, 1, 0, 0, 1]))
+    [(1, 3), (5, 6)]
+    """
+    return [match.span() for match in _SPAN.finditer(mask)]
+
+
+def parse_problems(input_lines: Sequence[str]) -> list[Problem]:
+    """Split a worksheet into problems; the last line holds the operators.
+
+    :param input_lines: Worksheet lines, with or without trailing newlines.
+    :returns: The problems from left to right.
+    """
+    rows = pad_rows(input_lines)
+    if not rows:
+        return []
+    numbers, ops = rows[:-1], rows[-1]
+    return [
+        Problem([row[start:stop] for row in numbers], ops[start:stop].strip().decode())
+        for start, stop in problem_spans(occupied_columns(numbers))
+    ]
+
+
+def row_numbers(block: Sequence[bytes]) -> list[int]:
+    """Read a problem's numbers one per row (Part 1 rules)."""
+    return [int(row) for row in block if row.strip()]
+
+
+def column_numbers(block: Sequence[bytes]) -> list[int]:
+    """Read a problem's numbers one per column, top digit most significant (Part 2 rules)."""
+    numbers: list[int] = []
+    for column in zip(*block, strict=True):
+        digits = bytes(column).replace(b" ", b"")
+        if digits:
+            numbers.append(int(digits))
+    return numbers
+
+
+def product_tree(numbers: Sequence[int]) -> int:
+    """Multiply numbers by balanced pairwise rounds instead of left to right.
+
+    Operands of similar size are multiplied together, so large products use
+    fast big-integer multiplication instead of many big-by-small steps.
+
+    Examples:
+    >>> product_tree([123, 45, 6]), product_tree([]), product_tree([7])
+    (33210, 1, 7)
+    """
+    level = list(numbers)
+    if not level:
+        return 1
+    while len(level) > 1:
+        paired = [a * b for a, b in zip(level[::2], level[1::2], strict=False)]
+        if len(level) % 2:
+            paired.append(level[-1])
+        level = paired
+    return level[0]
+
+
+type Operator = Callable[[Sequence[int]], int]
+
+OPERATORS: Mapping[str, Operator] = {"+": sum, "*": product_tree}
+
+
+def evaluate(
+    numbers: Sequence[int], op: str, operators: Mapping[str, Operator] = OPERATORS
+) -> int:
+    """Apply a problem's operator to its numbers.
+
+    :param numbers: The problem's numbers.
+    :param op: Operator symbol, looked up in ``operators``.
+    :param operators: Table from operator symbol to reduction function.
+    :returns: The reduction of the numbers.
+    :raises ValueError: If the operator is not in the table.
+
+    Examples:
+    >>> evaluate([123, 45, 6], "*"), evaluate([328, 64, 98], "+")
+    (33210, 490)
+    >>> evaluate([3, 9], "max", {"max": max})
+    9
+    """
+    try:
+        reduce = operators[op]
+    except KeyError:
+        raise ValueError(f"Unknown operator: {op}") from None
+    return reduce(numbers)
+
+
+def evaluate_all(
+    problems: Iterable[tuple[Sequence[int], str]],
+    workers: int = 1,
+    operators: Mapping[str, Operator] = OPERATORS,
+) -> int:
+    """Evaluate independent problems and return the grand total.
+
+    :param problems: ``(numbers, op)`` pairs.
+    :param workers: Number of processes; 1 evaluates in this process.
+    :param operators: Table from operator symbol to reduction function. It
+        must be picklable when ``workers`` is more than 1.
+    :returns: The sum of all problem results.
+    """
+    if workers <= 1:
+        return sum(evaluate(numbers, op, operators) for numbers, op in problems)
+    pairs = list(problems)
+    if not pairs:
+        return 0
+    numbers = [numbers for numbers, _ in pairs]
+    ops = [op for _, op in pairs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(
+            partial(evaluate, operators=operators),
+            numbers,
+            ops,
+            chunksize=max(1, len(numbers) // (workers * 4)),
+        )
+        return sum(results)
@@ -0,0 +1,157 @@
+"""Compiled Day 7 manifold answering queries from many start positions.
+
+The grid is parsed once into a jump table. For each column, it holds the
+sorted rows of the cells that stop a falling particle: splitters and
+absorbing cells. The next stop below any point is then one binary search.
+
+Each maximal run of adjacent splitters in a row is one node. Nodes are
+resolved from the bottom row up into timeline counts, so
+``timelines_from`` is a jump-table lookup in O(log height) time.
+
+Split counts need the number of *distinct* splitters a beam reaches. Beams
+that merge again would be counted twice by a sum over the DAG, and storing
+a reachable set per node costs O(splitters^2) memory. Instead, every row is
+also packed into bitmasks once, and ``splits_from`` runs the row sweep from
+``day07.sweep`` below the start. That costs O((height - y) * width / 64)
+word operations per query. Memory is O(cells / 8) for the bitmasks plus one
+count per node.
+
+A run of two or more splitters traps a particle forever, so its timeline
+count, and that of every node leading into it, is undefined. The split count
+for such a run is still well defined.
+"""
+
+import bisect
+import itertools
+from collections.abc import Iterable, Sequence
+from typing import NamedTuple
+
+from day07.sweep import row_masks, sweep_row
+
+EMPTY = "."
+SPLITTER = "^"
+START = "S"
+
+
+class Query(NamedTuple):
+    """Answers for one start position."""
+
+    splits: int
+    timelines: int
+
+
+class Manifold:
+    """Tachyon manifold compiled for repeated split and timeline queries."""
+
+    def __init__(self, grid: Sequence[str]) -> None:
+        """Build the jump table and row bitmasks and resolve every splitter run.
+
+        :param grid: Manifold rows of equal width, top to bottom.
+        """
+        self.height = len(grid)
+        self.width = len(grid[0]) if grid else 0
+        self.start: tuple[int, int] | None = None
+        self._stop_rows: list[list[int]] = [[] for _ in range(self.width)]
+        self._stop_nodes: list[list[int]] = [[] for _ in range(self.width)]
+        self._masks = [row_masks(row) for row in grid]
+        runs: list[tuple[int, int, int]] = []  # (row, first column, last column)
+        for y, row in enumerate(grid):
+            if self.start is None and START in row:
+                self.start = (row.index(START), y)
+            x = 0
+            while x < self.width:
+                if x >= len(row) or row[x] == EMPTY:
+                    x += 1
+                    continue
+                if row[x] != SPLITTER:
+                    self._add_stop(x, y, -1)
+                    x += 1
+                    continue
+                end = x
+                while end + 1 < min(self.width, len(row)) and row[end + 1] == SPLITTER:
+                    end += 1
+                for c in range(x, end + 1):
+                    self._add_stop(c, y, len(runs))
+                runs.append((y, x, end))
+                x = end + 1
+        self._timelines: list[int | None] = [None] * len(runs)
+        for node in range(len(runs) - 1, -1, -1):
+            y, first, last = runs[node]
+            left = self._enter(first - 1, y)
+            right = self._enter(last + 1, y)
+            if first == last and left is not None and right is not None:
+                self._timelines[node] = left + right
+
+    def _add_stop(self, x: int, y: int, node: int) -> None:
+        """Record a stopping cell; ``node`` is -1 for an absorbing cell."""
+        self._stop_rows[x].append(y)
+        self._stop_nodes[x].append(node)
+
+    def _enter(self, x: int, y: int) -> int | None:
+        """Return the timelines of a particle at ``(x, y)``, ``None`` if unbounded."""
+        if not 0 <= x < self.width or y >= self.height:
+            return 1
+        rows = self._stop_rows[x]
+        i = bisect.bisect_left(rows, y)
+        if i == len(rows):
+            return 1
+        node = self._stop_nodes[x][i]
+        if node < 0:
+            return 0
+        return self._timelines[node]
+
+    def beam_start(self) -> tuple[int, int]:
+        """Return the cell just below ``S``, where both puzzle parts start.
+
+        :raises ValueError: If the grid has no ``S``.
+        """
+        if self.start is None:
+            raise ValueError("No S found in grid")
+        x, y = self.start
+        return x, y + 1
+
+    def splits_from(self, x: int, y: int) -> int:
+        """Count the distinct splitters hit by a beam entering cell ``(x, y)``.
+
+        The rows from ``y`` down are swept with bitmasks, stopping early once
+        every beam has left the grid or been absorbed.
+
+        Examples:
+        >>> Manifold(["..S..", ".....", "..^..", ".^.^.", "....."]).splits_from(2, 1)
+        3
+        """
+        if not 0 <= x < self.width:
+            return 0
+        beams = 1 << x
+        splits = 0
+        for empty, splitters, mask in itertools.islice(self._masks, max(y, 0), None):
+            if not beams:
+                break
+            beams, hit = sweep_row(beams, empty, splitters, mask)
+            splits += hit
+        return splits
+
+    def timelines_from(self, x: int, y: int) -> int:
+        """Count the timelines of a particle entering cell ``(x, y)``.
+
+        :raises ValueError: If the particle can reach adjacent splitters.
+
+        Examples:
+        >>> Manifold(["..S..", ".....", "..^..", ".^.^.", "....."]).timelines_from(2, 1)
+        4
+        """
+        timelines = self._enter(x, y)
+        if timelines is None:
+            raise ValueError(f"Timelines from ({x}, {y}) reach adjacent splitters")
+        return timelines
+
+    def query_many(self, starts: Iterable[tuple[int, int]]) -> list[Query]:
+        """Answer split and timeline counts for many start cells.
+
+        :param starts: ``(x, y)`` cells where a beam enters.
+        :returns: One ``Query`` per start, in order.
+        :raises ValueError: If a start can reach adjacent splitters.
+        """
+        return [
+            Query(self.splits_from(x, y), self.timelines_from(x, y)) for x, y in starts
+        ]
@@ -1,51 +1,34 @@
-"""Day 7 Part 1: Count the number of beam splits in the tachyon manifold grid."""
+"""Day 7 Part 1: Count the number of beam splits in the tachyon manifold grid.
+
+Usage:
+    uv run python -m day07.part1 [input.txt]
+"""
+
+import os
+import sys
+
+from day07.sweep import count_splits_sweep
 
 
 def count_splits(grid: list[str]) -> int:
-    """Count the number of splits as the beam traverses the grid."""
-    height: int = len(grid)
-    width: int = len(grid[0])
-    # Find the S position
-    sx: int
-    sy: int
-    for y, row in enumerate(grid):
-        if "S" in row:
-            sx = row.index("S")
-            sy = y
-            break
+    """Count the number of splits as the beam traverses the grid.
+
+    The grid is swept row by row with bitsets; see ``day07.sweep``.
+    """
+    return count_splits_sweep(grid)
+
+
+def main() -> None:
+    """Read the manifold and print the number of splits.
+
+    Accepts the input file as a command-line argument, defaulting to input.txt
+    in the same directory.
+    """
+    if len(sys.argv) > 1:
+        input_path = sys.argv[1]
     else:
-        raise ValueError("No S found in grid")
-
-    # Each beam is (x, y, direction)
-    # For part 1, all beams move downward (direction = 'down')
-    beams: list[tuple[int, int]] = [(sx, sy + 1)]  # Start just below S
-    split_count: int = 0
-    visited: set[tuple[int, int]] = set()
-
-    while beams:
-        x, y = beams.pop()
-        if (x, y) in visited:
-            continue
-        visited.add((x, y))
-        if y >= height:
-            continue
-        cell: str = grid[y][x]
-        if cell == ".":
-            beams.append((x, y + 1))
-        elif cell == "^":
-            split_count += 1
-            # Split: left and right, if within bounds
-            if x > 0:
-                beams.append((x - 1, y))
-            if x < width - 1:
-                beams.append((x + 1, y))
-        # else: ignore (shouldn't happen)
-    return split_count
-
-
-def main():
-    """Read input.txt and print the number of splits."""
-    with open("input.txt") as f:
+        input_path = os.path.join(os.path.dirname(__file__), "input.txt")
+    with open(input_path) as f:
         grid = [line.rstrip("\n") for line in f if line.strip()]
     print(count_splits(grid))
 
@@ -0,0 +1,87 @@
+"""Row-sweep beam simulator for the Day 7 tachyon manifold.
+
+The beams entering a row are kept as one ``int`` bitset, with bit ``x`` set
+for column ``x``. A row is processed with whole-row bitwise operations.
+Beams that land on a splitter (``^``) light the cells to its left and right
+in the same row, which can chain through neighboring splitters. Beams on
+empty cells (``.``) continue down into the next row, and any other cell
+absorbs them. The splits in a row are the popcount of the lit splitters.
+Only one row is held at a time, so memory is O(width) however many rows
+the manifold has.
+"""
+
+from collections.abc import Iterable
+
+_EMPTY_BITS = bytes(ord("1") if b == ord(".") else ord("0") for b in range(256))
+_SPLITTER_BITS = bytes(ord("1") if b == ord("^") else ord("0") for b in range(256))
+
+
+def row_bits(row: str, table: bytes) -> int:
+    """Pack the cells of a row selected by a translate table into a bitset."""
+    return int(row.encode()[::-1].translate(table) or b"0", 2)
+
+
+def row_masks(row: str) -> tuple[int, int, int]:
+    """Pack a row into its empty-cell, splitter, and all-column bitmasks.
+
+    Examples:
+    >>> row_masks(".^#.")
+    (9, 2, 15)
+    """
+    return (
+        row_bits(row, _EMPTY_BITS),
+        row_bits(row, _SPLITTER_BITS),
+        (1 << len(row)) - 1,
+    )
+
+
+def sweep_row(beams: int, empty: int, splitters: int, mask: int) -> tuple[int, int]:
+    """Advance the beams entering one row.
+
+    :param beams: Columns where beams enter the row.
+    :param empty: Columns holding empty cells.
+    :param splitters: Columns holding splitters.
+    :param mask: Bits of all the row's columns.
+    :returns: The beams leaving the row downward and the number of splitters hit.
+
+    Examples:
+    >>> sweep_row(0b00100, 0b11011, 0b00100, 0b11111)
+    (10, 1)
+    >>> sweep_row(0b00100, 0b10001, 0b01110, 0b11111)
+    (17, 3)
+    """
+    lit = beams & mask
+    frontier = lit & splitters
+    while frontier:
+        spread = ((frontier << 1) | (frontier >> 1)) & mask & ~lit
+        lit |= spread
+        frontier = spread & splitters
+    return lit & empty, (lit & splitters).bit_count()
+
+
+def count_splits_sweep(rows: Iterable[str]) -> int:
+    """Count the splitters hit by the beam, one row at a time.
+
+    :param rows: Manifold rows from top to bottom; the beam starts below ``S``.
+    :returns: The number of splits, as counted by ``count_splits``.
+    :raises ValueError: If no row contains ``S``.
+
+    Examples:
+    >>> count_splits_sweep(["..S..", ".....", "..^..", ".^.^.", "....."])
+    3
+    """
+    beams = 0
+    started = False
+    splits = 0
+    for row in rows:
+        if not started:
+            if "S" in row:
+                beams = 1 << row.index("S")
+                started = True
+            continue
+        empty, splitters, mask = row_masks(row)
+        beams, hit = sweep_row(beams, empty, splitters, mask)
+        splits += hit
+    if not started:
+        raise ValueError("No S found in grid")
+    return splits
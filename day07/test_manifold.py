@@ -0,0 +1,56 @@
+"""Tests for the compiled day07 manifold."""
+
+import random
+
+import pytest
+
+from day07.manifold import Manifold, Query
+from day07.sweep import count_splits_sweep
+from day07.timelines import count_timelines_dp
+
+
+def _with_start(grid: list[str], x: int, y: int) -> list[str]:
+    """Return a copy of ``grid`` with ``S`` placed just above cell ``(x, y)``."""
+    width = len(grid[0])
+    rows = grid[:y]
+    return [*rows, "." * x + "S" + "." * (width - x - 1), *grid[y:]]
+
+
+def test_matches_single_query_solvers() -> None:
+    """Test every start cell of random manifolds against the one-shot solvers."""
+    rng = random.Random(22)
+    for _ in range(40):
+        width = rng.randint(1, 8)
+        grid = ["".join(rng.choice("...^^#") for _ in range(width)) for _ in range(8)]
+        manifold = Manifold(grid)
+        for y in range(len(grid) + 1):
+            for x in range(width):
+                single = _with_start(grid, x, y)
+                assert manifold.splits_from(x, y) == count_splits_sweep(single)
+                try:
+                    expected = count_timelines_dp(single)
+                except ValueError:
+                    continue  # Adjacent splitters somewhere below the start
+                assert manifold.timelines_from(x, y) == expected
+
+
+def test_real_input_and_batch() -> None:
+    """Test the puzzle start and a batch of starts on the real input."""
+    with open("day07/input.txt") as f:
+        manifold = Manifold([line.rstrip("\n") for line in f if line.strip()])
+    start = manifold.beam_start()
+    assert manifold.query_many([start, (0, manifold.height)]) == [
+        Query(1662, 40941112789504),
+        Query(0, 1),
+    ]
+
+
+def test_adjacent_splitters_and_missing_start() -> None:
+    """Test trapped particles and a grid without ``S``."""
+    manifold = Manifold(["...", ".^^", "..."])
+    assert manifold.splits_from(1, 0) == 2
+    assert manifold.timelines_from(0, 0) == 1
+    with pytest.raises(ValueError, match="adjacent splitters"):
+        manifold.timelines_from(2, 0)
+    with pytest.raises(ValueError, match="No S found"):
+        manifold.beam_start()
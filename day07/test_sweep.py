@@ -0,0 +1,52 @@
+"""Tests for the day07 row-sweep beam simulator."""
+
+import random
+
+import pytest
+
+from day07.sweep import count_splits_sweep
+
+
+def _count_splits_dfs(grid: list[str]) -> int:
+    """Count splits by walking the beam one cell at a time (the old solver)."""
+    width = len(grid[0])
+    sy = next(y for y, row in enumerate(grid) if "S" in row)
+    beams = [(grid[sy].index("S"), sy + 1)]
+    visited: set[tuple[int, int]] = set()
+    splits = 0
+    while beams:
+        x, y = beams.pop()
+        if (x, y) in visited or y >= len(grid):
+            continue
+        visited.add((x, y))
+        if grid[y][x] == ".":
+            beams.append((x, y + 1))
+        elif grid[y][x] == "^":
+            splits += 1
+            beams.extend((n, y) for n in (x - 1, x + 1) if 0 <= n < width)
+    return splits
+
+
+def test_matches_cell_walk() -> None:
+    """Test random manifolds, including adjacent splitters, against a cell walk."""
+    rng = random.Random(20)
+    for _ in range(300):
+        width = rng.randint(1, 12)
+        grid = ["".join(rng.choice("..^^#") for _ in range(width)) for _ in range(10)]
+        start = rng.randrange(width)
+        grid.insert(rng.randint(0, 3), "." * start + "S" + "." * (width - start - 1))
+        assert count_splits_sweep(grid) == _count_splits_dfs(grid)
+
+
+def test_real_input() -> None:
+    """Test the real input against the known answer."""
+    with open("day07/input.txt") as f:
+        assert (
+            count_splits_sweep(line.rstrip("\n") for line in f if line.strip()) == 1662
+        )
+
+
+def test_missing_start() -> None:
+    """Test that a grid without ``S`` is rejected."""
+    with pytest.raises(ValueError, match="No S found"):
+        count_splits_sweep(["...", ".^."])
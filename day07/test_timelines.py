@@ -0,0 +1,68 @@
+"""Tests for the day07 bottom-up timeline counter."""
+
+import random
+from functools import cache
+
+import pytest
+
+from day07.timelines import count_timelines_dp
+
+
+def _count_timelines_memo(grid: list[str]) -> int:
+    """Count timelines with the memoized recursion (the old solver)."""
+    height, width = len(grid), len(grid[0])
+    sy = next(y for y, row in enumerate(grid) if "S" in row)
+
+    @cache
+    def count_from(x: int, y: int) -> int:
+        if y >= height or x < 0 or x >= width:
+            return 1
+        if grid[y][x] == ".":
+            return count_from(x, y + 1)
+        if grid[y][x] == "^":
+            return count_from(x - 1, y) + count_from(x + 1, y)
+        return 0
+
+    return count_from(grid[sy].index("S"), sy + 1)
+
+
+def _random_row(rng: random.Random, width: int) -> str:
+    """Build a row with no two splitters side by side."""
+    cells: list[str] = []
+    for _ in range(width):
+        choices = ".#" if cells and cells[-1] == "^" else "..^^#"
+        cells.append(rng.choice(choices))
+    return "".join(cells)
+
+
+def test_matches_memoized_recursion() -> None:
+    """Test random manifolds, including edge exits, against the recursion."""
+    rng = random.Random(21)
+    for _ in range(300):
+        width = rng.randint(1, 10)
+        grid = [_random_row(rng, width) for _ in range(12)]
+        start = rng.randrange(width)
+        grid.insert(rng.randint(0, 3), "." * start + "S" + "." * (width - start - 1))
+        assert count_timelines_dp(grid) == _count_timelines_memo(grid)
+
+
+def test_tall_manifold() -> None:
+    """Test a manifold far taller than the recursion limit."""
+    grid = [".S.", *(["..."] * 50000), ".^.", *([".^."] * 50000)]
+    assert count_timelines_dp(grid) == 2
+
+
+def test_rejects_adjacent_splitters() -> None:
+    """Test that splitters bouncing a particle forever are rejected."""
+    with pytest.raises(ValueError, match="from column 2 reaches adjacent splitters"):
+        count_timelines_dp(["..S", ".^^"])
+    with pytest.raises(ValueError, match="reaches adjacent splitters"):
+        count_timelines_dp(["..S..", ".....", "..^..", "..^^.", "....."])
+    with pytest.raises(ValueError, match="No S found"):
+        count_timelines_dp([".."])
+
+
+def test_unreachable_adjacent_splitters() -> None:
+    """Test that adjacent splitters no particle reaches are harmless."""
+    grid = ["S....", ".....", "...^^", "....."]
+    assert count_timelines_dp(grid) == _count_timelines_memo(grid) == 1
@@ -0,0 +1,79 @@
+"""Bottom-up timeline counter for the Day 7 quantum manifold.
+
+``count_from(x, y)`` in the memoized recursion depends only on the row
+below and, at a splitter, on the two cells beside it in the same row. This
+module sweeps from the bottom row to the top and keeps one list of timeline
+counts per column, holding the counts for the row just below. Memory is
+O(width), and nothing recurses, so tall manifolds cannot hit the recursion
+limit.
+
+A timeline ends when its particle leaves the grid through the bottom, left,
+or right edge, and each such exit counts as 1. A cell that is neither ``.``
+nor ``^`` absorbs the particle and counts 0. Adjacent splitters would send
+the particle back and forth forever, and the recursion never returns for
+them. The sweep marks their cells, and every cell that leads into them, as
+unbounded (``None``). It raises only if the start cell is one of them, so
+unreachable adjacent splitters do no harm.
+"""
+
+from collections.abc import Sequence
+
+EMPTY = "."
+SPLITTER = "^"
+
+
+def _row_counts(row: str, below: list[int | None]) -> list[int | None]:
+    """Return the timeline counts for every cell of a row.
+
+    :param row: The row's cells.
+    :param below: Timeline counts for the row underneath; ``None`` marks a
+        cell whose particle is trapped by adjacent splitters.
+    :returns: The row's counts, with ``None`` for trapped cells.
+    """
+    width = len(below)
+    counts = [below[x] if cell == EMPTY else 0 for x, cell in enumerate(row[:width])]
+    for x, cell in enumerate(row[:width]):
+        if cell != SPLITTER:
+            continue
+        sides: int | None = 0
+        for n in (x - 1, x + 1):
+            if not 0 <= n < width:
+                side: int | None = 1
+            elif row[n] == SPLITTER:
+                side = None
+            else:
+                side = counts[n]
+            sides = None if sides is None or side is None else sides + side
+        counts[x] = sides
+    return counts
+
+
+def count_timelines_dp(grid: Sequence[str]) -> int:
+    """Count the timelines of a particle starting just below ``S``.
+
+    :param grid: Manifold rows of equal width, top to bottom.
+    :returns: The same count as the memoized ``count_from`` recursion.
+    :raises ValueError: If there is no ``S`` or the particle can reach two
+        adjacent splitters.
+
+    Examples:
+    >>> count_timelines_dp(["..S..", ".....", "..^..", ".^.^.", "....."])
+    4
+    >>> count_timelines_dp(["S^", ".."])
+    1
+    >>> count_timelines_dp(["S....", ".....", "...^^", "....."])
+    1
+    """
+    for sy, row in enumerate(grid):
+        if "S" in row:
+            sx = row.index("S")
+            break
+    else:
+        raise ValueError("No S found in grid")
+    counts: list[int | None] = [1] * len(grid[0])
+    for row in reversed(grid[sy + 1 :]):
+        counts = _row_counts(row, counts)
+    timelines = counts[sx]
+    if timelines is None:
+        raise ValueError(f"The particle from column {sx} reaches adjacent splitters")
+    return timelines
@@ -0,0 +1,62 @@
+"""Minimum spanning tree engine for the Day 8 junction boxes.
+
+Kruskal's algorithm over the sorted list of all pairs needs O(n^2) memory.
+Dense Prim's algorithm finds the same tree while keeping only one cheapest
+edge per box. Edges are ranked by the same ``(distance, i, j)`` order that
+Kruskal sorts by, using the same float distances. That order is strict, so
+both algorithms pick the same tree even when distinct squared distances
+round to equal floats. The edges are then sorted into the order Kruskal
+would add them. Every Kruskal prefix query can be answered from that
+sequence, for example the last edge that joins all boxes into one circuit.
+
+The NumPy backend in ``day08.vectorized`` is used when NumPy is installed.
+Otherwise a pure Python Prim's loop does the same work.
+"""
+
+from collections.abc import Sequence
+
+from day08.spatial import Box, distance
+
+try:
+    from day08 import vectorized
+except ImportError:  # NumPy is optional; fall back to the pure Python loop
+    vectorized = None
+
+
+def _prim_edges(boxes: Sequence[Box]) -> list[tuple[int, int]]:
+    """Return the MST edges, ranked by ``distance`` and then ``(i, j)``."""
+    n = len(boxes)
+    if n < 2:  # noqa: PLR2004
+        return []
+    best = [(distance(boxes[0], boxes[v]), 0, v) for v in range(n)]
+    remaining = list(range(1, n))
+    edges: list[tuple[int, int]] = []
+    while remaining:
+        k = min(range(len(remaining)), key=lambda t: best[remaining[t]])
+        w = remaining[k]
+        remaining[k] = remaining[-1]
+        remaining.pop()
+        _, i, j = best[w]
+        edges.append((i, j))
+        for v in remaining:
+            key = (distance(boxes[w], boxes[v]), min(v, w), max(v, w))
+            best[v] = min(best[v], key)
+    return edges
+
+
+def minimum_spanning_tree(boxes: Sequence[Box]) -> list[tuple[float, int, int]]:
+    """Return the minimum spanning tree edges in Kruskal order.
+
+    :param boxes: Box coordinates.
+    :returns: ``(distance, i, j)`` tuples with ``i < j``. These are exactly the
+        edges that Kruskal's algorithm accepts, in the order it accepts them,
+        when run over the sorted list of all pairs.
+
+    Examples:
+    >>> minimum_spanning_tree([(0, 0, 0), (5, 0, 0), (1, 0, 0), (0, 3, 4)])
+    [(1.0, 0, 2), (4.0, 1, 2), (5.0, 0, 3)]
+    """
+    edges = vectorized.prim_edges(boxes) if vectorized is not None else None
+    if edges is None:
+        edges = _prim_edges(boxes)
+    return sorted((distance(boxes[i], boxes[j]), i, j) for i, j in edges)
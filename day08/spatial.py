@@ -0,0 +1,136 @@
+"""k-d tree over junction boxes that yields box pairs nearest first.
+
+Sorting every pairwise distance costs O(n^2) memory. Instead, each box ``i``
+gets a lazy best-first search of a k-d tree, which yields the boxes
+``j > i`` in increasing distance. Tree nodes wait in that search's heap,
+keyed by the smallest possible distance to their bounding box. The
+per-box streams are merged through one more heap, so only the pairs that
+are actually consumed are ever produced.
+
+Distances are compared as exact squared integers. Pairs whose ``distance``
+floats are equal are emitted sorted by ``(i, j)``, so the output is
+identical to sorting the full list of ``(distance, i, j)`` tuples.
+"""
+
+import heapq
+from collections.abc import Iterator, Sequence
+
+type Box = tuple[int, int, int]
+
+LEAF_SIZE = 8  # Boxes stored in a leaf before the tree splits it
+
+
+def distance(box1: Box, box2: Box) -> float:
+    """Calculate 3D Euclidean distance between two boxes."""
+    x1, y1, z1 = box1
+    x2, y2, z2 = box2
+    return ((x2 - x1) ** 2 + (y2 - y1) ** 2 + (z2 - z1) ** 2) ** 0.5
+
+
+def squared_distance(box1: Box, box2: Box) -> int:
+    """Return the exact squared Euclidean distance between two boxes."""
+    return sum((a - b) ** 2 for a, b in zip(box1, box2, strict=True))
+
+
+class KDTree:
+    """Static k-d tree over box indices, stored as parallel node lists."""
+
+    def __init__(self, boxes: Sequence[Box], leaf_size: int = LEAF_SIZE) -> None:
+        """Build the tree by splitting the widest axis at the median.
+
+        :param boxes: Box coordinates; boxes are referred to by index.
+        :param leaf_size: Largest number of boxes kept in one leaf.
+        """
+        self.boxes = boxes
+        self.lo: list[Box] = []
+        self.hi: list[Box] = []
+        self.max_index: list[int] = []
+        self.children: list[tuple[int, int] | None] = []
+        self.members: list[list[int]] = []
+        if not boxes:
+            return
+        pending = [self._new_node(list(range(len(boxes))))]
+        while pending:
+            node = pending.pop()
+            indices = self.members[node]
+            if len(indices) <= leaf_size:
+                continue
+            lo, hi = self.lo[node], self.hi[node]
+            axis = max(range(3), key=lambda a: hi[a] - lo[a])
+            indices.sort(key=lambda i: boxes[i][axis])
+            middle = len(indices) // 2
+            left = self._new_node(indices[:middle])
+            right = self._new_node(indices[middle:])
+            self.children[node] = (left, right)
+            self.members[node] = []
+            pending += (left, right)
+
+    def _new_node(self, indices: list[int]) -> int:
+        """Append a leaf holding ``indices`` and return its node number."""
+        xs, ys, zs = zip(*(self.boxes[i] for i in indices), strict=True)
+        self.lo.append((min(xs), min(ys), min(zs)))
+        self.hi.append((max(xs), max(ys), max(zs)))
+        self.max_index.append(max(indices))
+        self.children.append(None)
+        self.members.append(indices)
+        return len(self.members) - 1
+
+    def box_distance(self, node: int, point: Box) -> int:
+        """Return the smallest squared distance from ``point`` to a node's bounding box."""
+        total = 0
+        for p, lo, hi in zip(point, self.lo[node], self.hi[node], strict=True):
+            gap = lo - p if p < lo else p - hi if p > hi else 0
+            total += gap * gap
+        return total
+
+    def neighbors_after(self, i: int) -> Iterator[tuple[int, int, int]]:
+        """Yield ``(squared distance, i, j)`` for every box ``j > i``, nearest first.
+
+        Ties in distance are yielded in increasing ``j``.
+        """
+        if not self.members:
+            return
+        point = self.boxes[i]
+        # Entries are (key, kind, item); at equal keys nodes (kind 0) are
+        # opened before boxes (kind 1), so ties come out in index order.
+        heap: list[tuple[int, int, int]] = [(0, 0, 0)]
+        while heap:
+            key, kind, item = heapq.heappop(heap)
+            if kind:
+                yield key, i, item
+                continue
+            children = self.children[item]
+            if children is None:
+                for j in self.members[item]:
+                    if j > i:
+                        heapq.heappush(
+                            heap, (squared_distance(point, self.boxes[j]), 1, j)
+                        )
+                continue
+            for child in children:
+                if self.max_index[child] > i:
+                    heapq.heappush(heap, (self.box_distance(child, point), 0, child))
+
+
+def nearest_pairs(boxes: Sequence[Box]) -> Iterator[tuple[float, int, int]]:
+    """Yield every pair of boxes as ``(distance, i, j)`` in sorted order.
+
+    :param boxes: Box coordinates.
+    :returns: A lazy iterator over the same tuples, in the same order, as the
+        sorted list of all pairs with ``i < j``.
+
+    Examples:
+    >>> pairs = nearest_pairs([(0, 0, 0), (5, 0, 0), (1, 0, 0), (0, 3, 4)])
+    >>> [next(pairs) for _ in range(4)]
+    [(1.0, 0, 2), (4.0, 1, 2), (5.0, 0, 1), (5.0, 0, 3)]
+    """
+    tree = KDTree(boxes)
+    merged = heapq.merge(*(tree.neighbors_after(i) for i in range(len(boxes))))
+    run: list[tuple[float, int, int]] = []
+    for _, i, j in merged:
+        dist = distance(boxes[i], boxes[j])
+        if run and dist != run[0][0]:
+            yield from sorted(run)
+            run.clear()
+        run.append((dist, i, j))
+    yield from sorted(run)
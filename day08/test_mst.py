@@ -0,0 +1,68 @@
+"""Tests for the day08 minimum spanning tree engine."""
+
+import itertools
+import random
+
+import pytest
+
+from day08 import mst
+from day08.mst import minimum_spanning_tree
+from day08.spatial import Box, distance
+
+
+def _kruskal(boxes: list[Box]) -> list[tuple[float, int, int]]:
+    """Return the edges Kruskal accepts from the sorted list of all pairs."""
+    pairs = sorted(
+        (distance(boxes[i], boxes[j]), i, j)
+        for i, j in itertools.combinations(range(len(boxes)), 2)
+    )
+    parent = list(range(len(boxes)))
+
+    def find(x: int) -> int:
+        while parent[x] != x:
+            x = parent[x]
+        return x
+
+    accepted: list[tuple[float, int, int]] = []
+    for edge in pairs:
+        root_i, root_j = find(edge[1]), find(edge[2])
+        if root_i != root_j:
+            parent[root_i] = root_j
+            accepted.append(edge)
+    return accepted
+
+
+def _random_boxes(rng: random.Random, count: int, span: int) -> list[Box]:
+    return [
+        (rng.randint(0, span), rng.randint(0, span), rng.randint(0, span))
+        for _ in range(count)
+    ]
+
+
+@pytest.mark.parametrize("numpy_backend", [True, False])
+def test_matches_kruskal(monkeypatch: pytest.MonkeyPatch, numpy_backend: bool) -> None:
+    """Test random boxes, with many distance ties, against Kruskal's algorithm."""
+    if not numpy_backend:
+        monkeypatch.setattr(mst, "vectorized", None)
+    rng = random.Random(24)
+    for count in (0, 1, 2, 5, 30, 80):
+        for span in (2, 10**5):
+            boxes = _random_boxes(rng, count, span)
+            assert minimum_spanning_tree(boxes) == _kruskal(boxes)
+
+
+def test_wide_coordinates_fall_back() -> None:
+    """Test coordinates too far apart for int64 squared distances."""
+    boxes = [(0, 0, 0), (2**40, 0, 0), (1, 2**40, 3), (5, 5, 5)]
+    assert minimum_spanning_tree(boxes) == _kruskal(boxes)
+
+
+@pytest.mark.parametrize("numpy_backend", [True, False])
+def test_float_equal_distances_tie_like_kruskal(
+    monkeypatch: pytest.MonkeyPatch, numpy_backend: bool
+) -> None:
+    """Test distinct squared distances that round to the same float distance."""
+    if not numpy_backend:
+        monkeypatch.setattr(mst, "vectorized", None)
+    boxes = [(0, 0, 0), (10**9, 1, 0), (10**9, 0, 0)]
+    assert minimum_spanning_tree(boxes) == _kruskal(boxes) == [(1.0, 1, 2), (1e9, 0, 1)]
@@ -0,0 +1,48 @@
+"""Tests for the day08 k-d tree pair generator."""
+
+import itertools
+import random
+
+from day08.spatial import KDTree, distance, nearest_pairs, squared_distance
+
+
+def _all_pairs_sorted(
+    boxes: list[tuple[int, int, int]],
+) -> list[tuple[float, int, int]]:
+    """Return every pair sorted by distance (the old approach)."""
+    pairs = [
+        (distance(boxes[i], boxes[j]), i, j)
+        for i, j in itertools.combinations(range(len(boxes)), 2)
+    ]
+    return sorted(pairs)
+
+
+def test_matches_full_sort() -> None:
+    """Test random boxes, with many distance ties, against sorting all pairs."""
+    rng = random.Random(23)
+    for count in (0, 1, 2, 3, 9, 40, 150):
+        span = rng.choice((3, 1000))
+        boxes = [
+            (rng.randint(0, span), rng.randint(0, span), rng.randint(0, span))
+            for _ in range(count)
+        ]
+        assert list(nearest_pairs(boxes)) == _all_pairs_sorted(boxes)
+
+
+def test_small_leaves_and_prefix() -> None:
+    """Test per-box streams of a deep tree and a prefix of the merged pairs."""
+    rng = random.Random(8)
+    boxes = [
+        (rng.randint(0, 9), rng.randint(0, 9), rng.randint(0, 9)) for _ in range(60)
+    ]
+    tree = KDTree(boxes, leaf_size=1)
+    for i in range(60):
+        stream = list(tree.neighbors_after(i))
+        expected = sorted(
+            (squared_distance(boxes[i], boxes[j]), i, j) for j in range(i + 1, 60)
+        )
+        assert stream == expected
+    assert (
+        list(itertools.islice(nearest_pairs(boxes), 25))
+        == _all_pairs_sorted(boxes)[:25]
+    )
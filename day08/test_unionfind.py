@@ -0,0 +1,46 @@
+"""Tests for the shared day08 union-find."""
+
+import random
+
+import pytest
+
+from day08.unionfind import UnionFind
+
+
+def test_matches_relabeling() -> None:
+    """Test random unions against relabeling every member of merged groups."""
+    rng = random.Random(25)
+    n = 200
+    uf = UnionFind(n)
+    label = list(range(n))
+    for _ in range(400):
+        x, y = rng.randrange(n), rng.randrange(n)
+        separate = label[x] != label[y]
+        assert uf.union(x, y) == separate
+        if separate:
+            old = label[y]
+            label = [label[x] if lab == old else lab for lab in label]
+        sizes = sorted((label.count(lab) for lab in set(label)), reverse=True)
+        assert uf.num_components == len(sizes)
+        if len(sizes) >= 3:
+            assert uf.largest_components(3) == sizes[:3]
+        assert uf.component_size(x) == label.count(label[x])
+
+
+def test_too_few_components() -> None:
+    """Test that asking for more components than exist is rejected."""
+    uf = UnionFind(4)
+    uf.union(0, 1)
+    uf.union(2, 3)
+    assert uf.largest_components(2) == [2, 2]
+    with pytest.raises(ValueError, match="fewer than 3"):
+        uf.largest_components(3)
+
+
+def test_long_chain_without_recursion() -> None:
+    """Test a chain far longer than the recursion limit."""
+    n = 200_000
+    uf = UnionFind(n)
+    for i in range(n - 1):
+        uf.parent[i] = i + 1  # Build a worst-case chain directly
+    assert uf.find(0) == n - 1
@@ -0,0 +1,74 @@
+"""Array-backed union-find shared by the Day 8 solutions.
+
+Parents and sizes live in ``array('i')`` buffers instead of dicts. ``find``
+halves paths iteratively, so no chain can hit the recursion limit, and
+``union`` hangs the smaller tree under the larger. The component count and
+the sizes of multi-box components are kept up to date on every union, so
+the largest circuits can be read off without a final ``find`` over every
+box.
+"""
+
+import heapq
+from array import array
+
+
+class UnionFind:
+    """Union-Find data structure for tracking connected components."""
+
+    def __init__(self, n: int) -> None:
+        """Initialize with n separate components."""
+        self.parent = array("i", range(n))
+        self.size = array("i", [1]) * n
+        self.num_components = n
+        self._multi_sizes: dict[int, int] = {}  # Root -> size, for sizes above 1
+
+    def find(self, x: int) -> int:
+        """Find the root of x, halving the path on the way."""
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, x: int, y: int) -> bool:
+        """Union two components. Returns True if they were separate."""
+        root_x = self.find(x)
+        root_y = self.find(y)
+        if root_x == root_y:
+            return False
+        if self.size[root_x] < self.size[root_y]:
+            root_x, root_y = root_y, root_x
+        self.parent[root_y] = root_x
+        self.size[root_x] += self.size[root_y]
+        self._multi_sizes.pop(root_y, None)
+        self._multi_sizes[root_x] = self.size[root_x]
+        self.num_components -= 1
+        return True
+
+    def component_size(self, x: int) -> int:
+        """Return the number of elements in x's component."""
+        return self.size[self.find(x)]
+
+    def largest_components(self, k: int) -> list[int]:
+        """Return the sizes of the ``k`` largest components, largest first.
+
+        :param k: Number of components to report.
+        :returns: The ``k`` largest component sizes.
+        :raises ValueError: If there are fewer than ``k`` components.
+
+        Examples:
+        >>> uf = UnionFind(6)
+        >>> uf.union(0, 1), uf.union(1, 2), uf.union(3, 4), uf.union(2, 0)
+        (True, True, True, False)
+        >>> uf.largest_components(3), uf.num_components
+        ([3, 2, 1], 3)
+        >>> uf.largest_components(4)
+        Traceback (most recent call last):
+        ...
+        ValueError: Only 3 components, fewer than 4
+        """
+        if self.num_components < k:
+            raise ValueError(f"Only {self.num_components} components, fewer than {k}")
+        sizes = heapq.nlargest(k, self._multi_sizes.values())
+        singletons = self.num_components - len(self._multi_sizes)
+        return sizes + [1] * min(k - len(sizes), singletons)
@@ -0,0 +1,92 @@
+"""NumPy backend for the Day 8 minimum spanning tree.
+
+Dense Prim's algorithm keeps, for every box outside the tree, its cheapest
+known edge into the tree. Each step adds the cheapest such box and then
+refreshes all the others from one vectorized row of squared distances.
+Memory is O(n) and the n - 1 steps each cost O(n) array work. The
+``minimum_spanning_tree`` engine uses this backend automatically when NumPy
+is installed.
+
+Edges are ranked by ``(distance, i, j)``, with the float ``distance`` that
+Kruskal sorts by. Squared distances decide every comparison whose square
+roots are clearly apart. Comparisons within ``_SLACK_ULPS`` of each other
+could round to equal floats, so they are redone in Python with the exact
+float key.
+"""
+
+from collections.abc import Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+MAX_SPAN = 1 << 30  # Coordinate spread whose squared distances fit in an int64
+_UNREACHED = np.iinfo(np.int64).max
+_SLACK_ULPS = 4  # Square roots this close may round to the same distance float
+
+
+def _key(d2: int, lo: int, hi: int) -> tuple[float, int, int]:
+    """Return Kruskal's sort key for an edge; ``d2 ** 0.5`` matches ``distance``."""
+    return d2**0.5, lo, hi
+
+
+def _close(a: NDArray[np.float64], b: NDArray[np.float64]) -> NDArray[np.bool_]:
+    """Mark square roots too close to order without the exact float keys."""
+    return np.abs(a - b) <= _SLACK_ULPS * np.spacing(np.maximum(a, b))
+
+
+def prim_edges(boxes: Sequence[tuple[int, int, int]]) -> list[tuple[int, int]] | None:
+    """Return the MST edges as ``(i, j)`` pairs with ``i < j``, in the order Prim adds them.
+
+    Edges are ranked by ``(distance, i, j)``. That is a strict total order,
+    so the tree is unique and the same one Kruskal's algorithm builds.
+
+    :param boxes: Box coordinates.
+    :returns: The ``len(boxes) - 1`` tree edges, or ``None`` if the coordinates
+        spread too far for ``int64`` arithmetic.
+
+    Examples:
+    >>> prim_edges([(0, 0, 0), (5, 0, 0), (1, 0, 0)])
+    [(0, 2), (1, 2)]
+    """
+    n = len(boxes)
+    if n < 2:  # noqa: PLR2004
+        return []
+    try:
+        points = np.asarray(boxes, dtype=np.int64)
+    except OverflowError:
+        return None
+    if int(points.max()) - int(points.min()) >= MAX_SPAN:
+        return None
+    index = np.arange(n)
+    in_tree = np.zeros(n, dtype=np.bool_)
+    in_tree[0] = True
+    best = ((points - points[0]) ** 2).sum(axis=1)
+    best_lo = np.zeros(n, dtype=np.int64)
+    best_hi = index.copy()
+    edges: list[tuple[int, int]] = []
+    for _ in range(n - 1):
+        open_best = np.where(in_tree, _UNREACHED, best)
+        roots = np.sqrt(open_best.astype(np.float64))
+        least = roots.min()
+        ties = np.flatnonzero(_close(roots, np.full_like(roots, least)))
+        w = min(
+            ties.tolist(),
+            key=lambda v: _key(int(best[v]), int(best_lo[v]), int(best_hi[v])),
+        )
+        edges.append((int(best_lo[w]), int(best_hi[w])))
+        in_tree[w] = True
+        row = ((points - points[w]) ** 2).sum(axis=1)
+        lo = np.minimum(index, w)
+        hi = np.maximum(index, w)
+        close = _close(
+            np.sqrt(row.astype(np.float64)), np.sqrt(best.astype(np.float64))
+        )
+        better = ~close & (row < best)
+        for v in np.flatnonzero(close & ~in_tree).tolist():
+            new = _key(int(row[v]), int(lo[v]), int(hi[v]))
+            better[v] = new < _key(int(best[v]), int(best_lo[v]), int(best_hi[v]))
+        better &= ~in_tree
+        best[better] = row[better]
+        best_lo[better] = lo[better]
+        best_hi[better] = hi[better]
+    return edges